@@ -1,19 +1,18 @@
 #!/usr/bin/env python3
 
-import argparse, logging, os, sys, traceback, time
-from logging.handlers import RotatingFileHandler
+import argparse, logging, math, os, sys, time
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
+import queue
 from urllib.parse import urlparse
 # openCV imports
-from cv2 import cvtColor, COLOR_BGR2RGB
 # Qt imports
-from PyQt5.QtCore import Qt, pyqtSlot, pyqtSignal, QSize, QThread, QMutex
+from PyQt5.QtCore import Qt, pyqtSlot, pyqtSignal, QSize, QSignalBlocker, QThread, QMutex, QEventLoop, QTimer
 from PyQt5.QtGui import QIcon, QPixmap
 from PyQt5.QtWidgets import QMainWindow, QDesktopWidget, QStyle, QWidget, QMenu, QAction, QStatusBar, QLabel, QHBoxLayout, QVBoxLayout, QTextEdit, QPushButton, QApplication, QTabWidget, QButtonGroup, QGridLayout, QFrame, QCheckBox
 # Other imports
 import json
 import numpy as np
 import copy
-import threading
 # Custom modules import
 from modules.SettingsDialog import SettingsDialog
 from modules.ConnectionDialog import ConnectionDialog
@@ -21,6 +20,122 @@ from modules.DetectionManager import DetectionManager
 from modules.PrinterManager import PrinterManager
 from modules.StatusTipFilter import StatusTipFilter
 
+########################################################################### Global stylesheet
+# parsed by Qt once per setStyleSheet call; kept as a module constant so window
+# construction doesn't rebuild the string from backslash continuations
+_globalStylesheet = '''
+    QLabel#instructions_text {
+        background-color: rgba(255,153,0,.4);
+    }
+    QPushButton {
+        border: 1px solid #adadad;
+        border-style: outset;
+        border-radius: 4px;
+        font: 16px;
+        padding: 2px;
+    }
+    QPushButton>QToolTip {
+        color: black;
+    }
+    QPushButton#calibrating:enabled {
+        background-color: orange;
+        color: white;
+    }
+    QPushButton#completed:enabled {
+        background-color: blue;
+        color: white;
+    }
+    QPushButton:hover,QPushButton:enabled:hover,QPushButton:enabled:!checked:hover,QPushButton#completed:enabled:hover {
+        background-color: #003874;
+        color: #ffa000;
+        border: 1px solid #aaaaaa;
+    }
+    QPushButton:pressed,QPushButton:enabled:pressed,QPushButton:enabled:checked,QPushButton#completed:enabled:pressed {
+        background-color: #ffa000;
+        border: 1px solid #aaaaaa;
+    }
+    QPushButton:enabled {
+        background-color: green;
+        color: white;
+    }
+    QLabel#labelPlus {
+        font: 20px;
+        padding: 0px;
+    }
+    QPushButton#plus:enabled {
+        font: 20px;
+        padding: 0px;
+        background-color: #eeeeee;
+        color: #000000;
+    }
+    QPushButton#plus:enabled:hover {
+        font: 20px;
+        padding: 0px;
+        background-color: green;
+        color: #000000;
+    }
+    QPushButton#plus:enabled:pressed {
+        font: 20px;
+        padding: 0px;
+        background-color: #FF0000;
+        color: #222222;
+    }
+    QPushButton#debug,QMessageBox > #debug {
+        background-color: blue;
+        color: white;
+    }
+    QPushButton#debug:hover, QMessageBox > QAbstractButton#debug:hover {
+        background-color: green;
+        color: white;
+    }
+    QPushButton#debug:pressed, QMessageBox > QAbstractButton#debug:pressed {
+        background-color: #ffa000;
+        border-style: inset;
+        color: white;
+    }
+    QPushButton#active, QMessageBox > QAbstractButton#active {
+        background-color: green;
+        color: white;
+    }
+    QPushButton#active:pressed,QMessageBox > QAbstractButton#active:pressed {
+        background-color: #ffa000;
+    }
+    QPushButton#terminate {
+        background-color: red;
+        color: white;
+    }
+    QPushButton#terminate:pressed {
+        background-color: #c0392b;
+    }
+    QPushButton:disabled, QPushButton#terminate:disabled {
+        background-color: #cccccc;
+        color: #999999;
+    }
+    QInputDialog QDialogButtonBox > QPushButton:enabled, QDialog QPushButton:enabled,QPushButton[checkable="true"]:enabled {
+        background-color: none;
+        color: black;
+        border: 1px solid #adadad;
+        border-style: outset;
+        border-radius: 4px;
+        font: 14px;
+        padding: 6px;
+    }
+    QPushButton:enabled:checked {
+        background-color: #ffa000;
+        border: 1px solid #aaaaaa;
+    }
+    QInputDialog QDialogButtonBox > QPushButton:pressed, QDialog QPushButton:pressed {
+        background-color: #ffa000;
+    }
+    QInputDialog QDialogButtonBox > QPushButton:hover:!pressed, QDialog QPushButton:hover:!pressed {
+        background-color: #003874;
+        color: #ffa000;
+    }
+    QToolTip, QLabel > QToolTip, QPushButton > QLabel> QToolTip {
+        color: black;
+    }
+'''
+
 ########################################################################### Core application class
 class App(QMainWindow):
     # Global mutex
@@ -67,6 +182,10 @@ class App(QMainWindow):
     # Timeout for Qthread termination (DetectionManager and PrinterManager)
     __detectionManagerThreadWaitTime = 20
     __printerManagerThreadWaitTime = 60
+    # Memoized sanitizeURL results, keyed by raw input string
+    __sanitizedURLCache = {}
+    # Camera calibration move coordinates (constant circle of sample points)
+    __calibrationCoordinates = np.array([ [0,-0.5], [0.294,-0.405], [0.476,-0.155], [0.476,0.155], [0.294,0.405], [0,0.5], [-0.294,0.405], [-0.476,0.155], [-0.476,-0.155], [-0.294,-0.405] ])
     
     ########################################################################### Initialize class
     def __init__(self, parent=None):
@@ -135,145 +254,35 @@ class App(QMainWindow):
             self.move(appScreen.topLeft())
             self.centralWidget = QWidget()
             self.setCentralWidget(self.centralWidget)
-            #  create stylehseets
-            self.globalStylesheet = '\
-                QLabel#instructions_text {\
-                    background-color: rgba(255,153,0,.4);\
-                }\
-                QPushButton {\
-                    border: 1px solid #adadad;\
-                    border-style: outset;\
-                    border-radius: 4px;\
-                    font: 16px;\
-                    padding: 2px;\
-                }\
-                QPushButton>QToolTip {\
-                    color: black;\
-                }\
-                QPushButton#calibrating:enabled {\
-                    background-color: orange;\
-                    color: white;\
-                }\
-                QPushButton#completed:enabled {\
-                    background-color: blue;\
-                    color: white;\
-                }\
-                QPushButton:hover,QPushButton:enabled:hover,QPushButton:enabled:!checked:hover,QPushButton#completed:enabled:hover {\
-                    background-color: #003874;\
-                    color: #ffa000;\
-                    border: 1px solid #aaaaaa;\
-                }\
-                QPushButton:pressed,QPushButton:enabled:pressed,QPushButton:enabled:checked,QPushButton#completed:enabled:pressed {\
-                    background-color: #ffa000;\
-                    border: 1px solid #aaaaaa;\
-                }\
-                QPushButton:enabled {\
-                    background-color: green;\
-                    color: white;\
-                }\
-                QLabel#labelPlus {\
-                    font: 20px;\
-                    padding: 0px;\
-                }\
-                QPushButton#plus:enabled {\
-                    font: 20px;\
-                    padding: 0px;\
-                    background-color: #eeeeee;\
-                    color: #000000;\
-                }\
-                QPushButton#plus:enabled:hover {\
-                    font: 20px;\
-                    padding: 0px;\
-                    background-color: green;\
-                    color: #000000;\
-                }\
-                QPushButton#plus:enabled:pressed {\
-                    font: 20px;\
-                    padding: 0px;\
-                    background-color: #FF0000;\
-                    color: #222222;\
-                }\
-                QPushButton#debug,QMessageBox > #debug {\
-                    background-color: blue;\
-                    color: white;\
-                }\
-                QPushButton#debug:hover, QMessageBox > QAbstractButton#debug:hover {\
-                    background-color: green;\
-                    color: white;\
-                }\
-                QPushButton#debug:pressed, QMessageBox > QAbstractButton#debug:pressed {\
-                    background-color: #ffa000;\
-                    border-style: inset;\
-                    color: white;\
-                }\
-                QPushButton#active, QMessageBox > QAbstractButton#active {\
-                    background-color: green;\
-                    color: white;\
-                }\
-                QPushButton#active:pressed,QMessageBox > QAbstractButton#active:pressed {\
-                    background-color: #ffa000;\
-                }\
-                QPushButton#terminate {\
-                    background-color: red;\
-                    color: white;\
-                }\
-                QPushButton#terminate:pressed {\
-                    background-color: #c0392b;\
-                }\
-                QPushButton:disabled, QPushButton#terminate:disabled {\
-                    background-color: #cccccc;\
-                    color: #999999;\
-                }\
-                QInputDialog QDialogButtonBox > QPushButton:enabled, QDialog QPushButton:enabled,QPushButton[checkable="true"]:enabled {\
-                    background-color: none;\
-                    color: black;\
-                    border: 1px solid #adadad;\
-                    border-style: outset;\
-                    border-radius: 4px;\
-                    font: 14px;\
-                    padding: 6px;\
-                }\
-                QPushButton:enabled:checked {\
-                    background-color: #ffa000;\
-                    border: 1px solid #aaaaaa;\
-                }\
-                QInputDialog QDialogButtonBox > QPushButton:pressed, QDialog QPushButton:pressed {\
-                    background-color: #ffa000;\
-                }\
-                QInputDialog QDialogButtonBox > QPushButton:hover:!pressed, QDialog QPushButton:hover:!pressed {\
-                    background-color: #003874;\
-                    color: #ffa000;\
-                }\
-            QToolTip, QLabel > QToolTip, QPushButton > QLabel> QToolTip {\
-                    color: black;\
-                }\
-                '
+            #  create stylesheets
+            self.globalStylesheet = _globalStylesheet
             self.setStyleSheet(self.globalStylesheet)
         #### Driver API imports
         if(True):
             try:
                 self.__firmwareList = []
                 self.__driverList = []
-                with open('drivers.json','r') as inputfile:
-                    driverJSON = json.load(inputfile)
+                # binary read + one loads call skips the io layer's text decoding path
+                with open('drivers.json','rb') as inputfile:
+                    driverJSON = json.loads(inputfile.read())
                 _logger.info('  .. loading drivers..')
                 for driverEntry in driverJSON:
                     self.__firmwareList.append(driverEntry['firmware'])
                     self.__driverList.append(driverEntry['filename'])            
             except:
-                _logger.critical('Cannot load driver definitions: ' + traceback.format_exc())
+                _logger.critical('Cannot load driver definitions', exc_info=True)
                 raise SystemExit('Cannot load driver definitions.')
         #### Setup components
         #  load user parameters
         if(True):
             try:
-                with open('./config/settings.json','r') as inputfile:
-                    self.__userSettings = json.load(inputfile)
+                with open('./config/settings.json','rb') as inputfile:
+                    self.__userSettings = json.loads(inputfile.read())
             except FileNotFoundError:
                 try:
                     # try and see if moving from older build
-                    with open('./settings.json','r') as inputfile:
-                        self.__userSettings = json.load(inputfile)
+                    with open('./settings.json','rb') as inputfile:
+                        self.__userSettings = json.loads(inputfile.read())
                     try:
                         _logger.info('  .. moving settings file to /config/settings.json.. ')
                         # create config folder if it doesn't exist
@@ -322,30 +331,21 @@ class App(QMainWindow):
                         self._videoSrc = self.__userSettings['camera'][0]['video_src']
                         # save default settings file
                         with open('./config/settings.json','w') as outputfile:
-                            json.dump(self.__userSettings, outputfile)
+                            outputfile.write(json.dumps(self.__userSettings))
                     except Exception as e1:
-                        errorMsg = 'Error reading user settings file.' + traceback.format_exc()
-                        _logger.critical(errorMsg)
+                        errorMsg = 'Error reading user settings file.'
+                        _logger.critical(errorMsg, exc_info=True)
                         raise SystemExit(errorMsg)
             _logger.info('  .. reading configuration settings..')
         # Fetch defined cameras
         if(True):
-            defaultCameraDefined = False
-            for source in self.__userSettings['camera']:
-                try:
-                    self.__cameras.append(source)
-                    if(source['default'] == 1 and defaultCameraDefined is False):
-                        self.__activeCamera = source
-                        defaultCameraDefined = True
-                    elif(defaultCameraDefined):
-                        source['default'] = 0
-                    continue
-                except KeyError as ke:
-                    source['default'] = 0
-                    continue
-            if(defaultCameraDefined is False):
-                self.__userSettings['camera'][0]['default'] = 1
-                self.__activeCamera = self.__userSettings['camera'][0]
+            self.__cameras.extend(self.__userSettings['camera'])
+            # pass 1: find the first source flagged as the default, falling back
+            # to the first camera when no flag is set
+            self.__activeCamera = next((source for source in self.__cameras if source.get('default') == 1), self.__cameras[0])
+            # pass 2: normalize the flags so exactly one camera is the default
+            for source in self.__cameras:
+                source['default'] = 1 if(source is self.__activeCamera) else 0
             self._cameraHeight = int(self.__activeCamera['display_height'])
             self._cameraWidth = int(self.__activeCamera['display_width'])
             self._videoSrc = self.__activeCamera['video_src']
@@ -353,56 +353,22 @@ class App(QMainWindow):
                 self._videoSrc = int(self._videoSrc)
         # Fetch defined machines
         if(True):
-            defaultPrinterDefined = False
-            for machine in self.__userSettings['printer']:
-                # Find default printer first
-                try:
-                    self.__printers.append(machine)
-                    if(machine['default'] == 1):
-                        self.__activePrinter = machine
-                        defaultPrinterDefined = True
-                except KeyError as ke:
-                    # no default field detected - create a default if not already done
-                    if(defaultPrinterDefined is False):
-                        machine['default'] = 1
-                        defaultPrinterDefined = True
-                    else:
-                        machine['default'] = 0
-                # Check if password doesn't exist
-                try:
-                    temp = machine['password']
-                except KeyError:
-                    machine['password'] = 'reprap'
-                # Check if nickname doesn't exist
-                try:
-                    temp = machine['nickname']
-                except KeyError:
-                    machine['nickname'] = machine['name']
-                # Check if controller doesn't exist
-                try:
-                    temp = machine['controller']
-                except KeyError:
-                    machine['controller'] = 'RRF'
-                # Check if version doesn't exist
-                try:
-                    temp = machine['version']
-                except KeyError:
-                    machine['version'] = ''
-                # Check if rotated kinematics doesn't exist
-                try:
-                    temp = machine['rotated']
-                except KeyError:
-                    machine['rotated'] = 0
-                # Check if tools doesn't exist
-                try:
-                    temp = machine['tools']
-                except KeyError:
-                    machine['tools'] = [ { 'number': 0, 'name': 'Tool 0', 'nozzleSize': 0.4, 'offsets': [0,0,0] } ]
-                if(machine['default'] == 1):
-                    self.__activePrinter = machine
-            # Check if we have no default machine
-            if(defaultPrinterDefined is False):
-                self.__activePrinter = self.__userSettings['printer'][0]
+            self.__printers.extend(self.__userSettings['printer'])
+            for machine in self.__printers:
+                # fill in any missing profile fields with their defaults; setdefault is
+                # a single hash lookup instead of a try/except KeyError per field
+                machine.setdefault('password', 'reprap')
+                machine.setdefault('nickname', machine.get('name'))
+                machine.setdefault('controller', 'RRF')
+                machine.setdefault('version', '')
+                machine.setdefault('rotated', 0)
+                machine.setdefault('tools', [ { 'number': 0, 'name': 'Tool 0', 'nozzleSize': 0.4, 'offsets': [0,0,0] } ])
+            # pass 1: find the first machine flagged as the default, falling back
+            # to the first profile when no flag is set
+            self.__activePrinter = next((machine for machine in self.__printers if machine.get('default') == 1), self.__printers[0])
+            # pass 2: normalize the flags so exactly one machine is the default
+            for machine in self.__printers:
+                machine['default'] = 1 if(machine is self.__activePrinter) else 0
             if(self.__activePrinter['controller'] == 'RRF'):
                 (_errCode, _errMsg, self.printerURL) = self.sanitizeURL(self.__activePrinter['address'])
                 self.__activePrinter['address'] = self.printerURL
@@ -565,19 +531,18 @@ class App(QMainWindow):
                 self.jogPanel.setSpacing(5)
                 
                 # create jogPanel buttons
+                # every jog button shares the same geometry, so build them from a
+                # table instead of repeating the setter boilerplate per button
                 ## increment size
-                self.button_1 = QPushButton('1')
-                self.button_1.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_1.setMaximumHeight(self.pushbuttonSize)
-                self.button_1.setToolTip('set jog distance to 1 unit')
-                self.button_01 = QPushButton('.1')
-                self.button_01.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_01.setMaximumHeight(self.pushbuttonSize)
-                self.button_01.setToolTip('set jog distance to 0.1 unit')
-                self.button_001 = QPushButton('.01')
-                self.button_001.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_001.setMaximumHeight(self.pushbuttonSize)
-                self.button_001.setToolTip('set jog distance to 0.01 unit')
+                for (attribute, label, tooltip) in (
+                        ('button_1', '1', 'set jog distance to 1 unit'),
+                        ('button_01', '.1', 'set jog distance to 0.1 unit'),
+                        ('button_001', '.01', 'set jog distance to 0.01 unit')):
+                    button = QPushButton(label)
+                    button.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
+                    button.setMaximumHeight(self.pushbuttonSize)
+                    button.setToolTip(tooltip)
+                    setattr(self, attribute, button)
                 self.incrementButtonGroup = QButtonGroup()
                 self.incrementButtonGroup.addButton(self.button_1)
                 self.incrementButtonGroup.addButton(self.button_01)
@@ -598,60 +563,36 @@ class App(QMainWindow):
                 self.keypadLine.setFrameShadow(QFrame.Sunken)
                 self.keypadLine.setLineWidth(1)
 
-                ## X movement
-                self.button_x_left = QPushButton('-X', objectName='plus')
-                self.button_x_left.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_x_left.setMaximumHeight(self.pushbuttonSize)
-                self.button_x_left.setToolTip('jog X-')
-                self.button_x_left.clicked.connect(self.xleftClicked)
-                self.button_x_right = QPushButton('X+', objectName='plus')
-                self.button_x_right.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_x_right.setMaximumHeight(self.pushbuttonSize)
-                self.button_x_right.setToolTip('jog X+')
-                self.button_x_right.clicked.connect(self.xRightClicked)
-                
-                ## Y movement
-                self.button_y_left = QPushButton('-Y', objectName='plus')
-                self.button_y_left.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_y_left.setMaximumHeight(self.pushbuttonSize)
-                self.button_y_left.setToolTip('jog Y-')
-                self.button_y_left.clicked.connect(self.yleftClicked)
-                self.button_y_right = QPushButton('Y+', objectName='plus')
-                self.button_y_right.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_y_right.setMaximumHeight(self.pushbuttonSize)
-                self.button_y_right.setToolTip('jog Y+')
-                self.button_y_right.clicked.connect(self.yRightClicked)
-                
-                ## Z movement
-                self.button_z_down = QPushButton('-Z', objectName='plus')
-                self.button_z_down.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_z_down.setMaximumHeight(self.pushbuttonSize)
-                self.button_z_down.setToolTip('jog Z-')
-                self.button_z_down.clicked.connect(self.zleftClicked)
-                self.button_z_up = QPushButton('Z+', objectName='plus')
-                self.button_z_up.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
-                self.button_z_up.setMaximumHeight(self.pushbuttonSize)
-                self.button_z_up.setToolTip('jog Z+')
-                self.button_z_up.clicked.connect(self.zRightClicked)
+                ## X/Y/Z movement
+                for (attribute, label, tooltip, handler) in (
+                        ('button_x_left', '-X', 'jog X-', self.xleftClicked),
+                        ('button_x_right', 'X+', 'jog X+', self.xRightClicked),
+                        ('button_y_left', '-Y', 'jog Y-', self.yleftClicked),
+                        ('button_y_right', 'Y+', 'jog Y+', self.yRightClicked),
+                        ('button_z_down', '-Z', 'jog Z-', self.zleftClicked),
+                        ('button_z_up', 'Z+', 'jog Z+', self.zRightClicked)):
+                    button = QPushButton(label, objectName='plus')
+                    button.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
+                    button.setMaximumHeight(self.pushbuttonSize)
+                    button.setToolTip(tooltip)
+                    button.clicked.connect(handler)
+                    setattr(self, attribute, button)
                 
                 ## layout jogPanel buttons
-                # add increment buttons
-                self.jogPanel.addWidget(self.button_001,0,0)
-                self.jogPanel.addWidget(self.button_01,0,1)
-                self.jogPanel.addWidget(self.button_1,1,1)
-                # add separator
-                self.jogPanel.addWidget(self.incrementLine, 2,0,1,2)
-                # add X movement buttons
-                self.jogPanel.addWidget(self.button_x_left,3,0)
-                self.jogPanel.addWidget(self.button_x_right,3,1)
-                # add Y movement buttons
-                self.jogPanel.addWidget(self.button_y_left,4,0)
-                self.jogPanel.addWidget(self.button_y_right,4,1)
-                # add Z movement buttons
-                self.jogPanel.addWidget(self.button_z_down,5,0)
-                self.jogPanel.addWidget(self.button_z_up,5,1)
-                # add separator
-                self.jogPanel.addWidget(self.keypadLine, 6,0,1,2)
+                # placement table: increment buttons, separator, X/Y/Z rows, separator
+                for (widget, row, column, rowSpan, columnSpan) in (
+                        (self.button_001, 0, 0, 1, 1),
+                        (self.button_01, 0, 1, 1, 1),
+                        (self.button_1, 1, 1, 1, 1),
+                        (self.incrementLine, 2, 0, 1, 2),
+                        (self.button_x_left, 3, 0, 1, 1),
+                        (self.button_x_right, 3, 1, 1, 1),
+                        (self.button_y_left, 4, 0, 1, 1),
+                        (self.button_y_right, 4, 1, 1, 1),
+                        (self.button_z_down, 5, 0, 1, 1),
+                        (self.button_z_up, 5, 1, 1, 1),
+                        (self.keypadLine, 6, 0, 1, 2)):
+                    self.jogPanel.addWidget(widget, row, column, rowSpan, columnSpan)
                 
                 self.tabPanel.setDisabled(True)
                 self.mainLayout.addWidget(self.tabPanel)
@@ -819,64 +760,70 @@ class App(QMainWindow):
     
     ########################################################################### GUI State functions
     def stateDisconnected(self):
-        # Settings option in menu
-        self.preferencesAction.setDisabled(False)
-        # Connect button
-        self.connectButton.setVisible(True)
-        self.connectButton.setDisabled(False)
-        self.connectButton.setStyleSheet(self.styleGreen)
-        # Disconnect button
-        self.disconnectButton.setVisible(False)
-        self.disconnectButton.setDisabled(True)
-        self.disconnectButton.setStyleSheet(self.styleDisabled)
-        # Setup CP button
-        self.cpSetupButton.setVisible(False)
-        self.cpSetupButton.setDisabled(True)
-        self.cpSetupButton.setStyleSheet(self.styleDisabled)
-        # CP Automated Capture button
-        self.cpAutoCaptureButton.setVisible(False)
-        self.cpAutoCaptureButton.setDisabled(True)
-        self.cpAutoCaptureButton.setStyleSheet(self.styleDisabled)
-        # Manual capture button
-        self.manualCPCaptureButton.setVisible(False)
-        self.manualCPCaptureButton.setDisabled(True)
-        self.manualCPCaptureButton.setStyleSheet(self.styleDisabled)
-        # Start Alignment button
-        self.startAlignToolsButton.setVisible(False)
-        self.startAlignToolsButton.setDisabled(True)
-        self.startAlignToolsButton.setText('Align Tools')
-        self.startAlignToolsButton.setStyleSheet(self.styleDisabled)
-        # Override Manual Tool offset Capture button
-        self.overrideManualOffsetCaptureButton.setVisible(False)
-        self.overrideManualOffsetCaptureButton.setDisabled(True)
-        self.overrideManualOffsetCaptureButton.setStyleSheet(self.styleDisabled)
-        # Manual Tool offset Capture button
-        self.manualToolOffsetCaptureButton.setDisabled(True)
-        self.manualToolOffsetCaptureButton.setVisible(False)
-        self.manualToolOffsetCaptureButton.setStyleSheet(self.styleDisabled)
-        # Resume auto alignment button
-        self.resumeAutoToolAlignmentButton.setVisible(False)
-        self.resumeAutoToolAlignmentButton.setDisabled(True)
-        self.resumeAutoToolAlignmentButton.setStyleSheet(self.styleDisabled)
-        # Delete tool buttons
-        count = self.jogPanel.count()
-        for i in range(11,count):
-            item = self.jogPanel.itemAt(i)
-            widget = item.widget()
-            widget.setVisible(False)
-            # widget.deleteLater()
-        self.resetCalibration()
-        # Crosshair display button
-        self.crosshairDisplayButton.setVisible(True)
-        self.crosshairDisplayButton.setDisabled(False)
-        if(self.__displayCrosshair):
-            self.crosshairDisplayButton.setStyleSheet(self.styleOrange)
-            self.crosshairDisplayButton.setChecked(True)
-        else:
-            self.crosshairDisplayButton.setStyleSheet(self.styleBlue)
-            self.crosshairDisplayButton.setChecked(False)
-        # Jog panel tab
-        self.tabPanel.setDisabled(True)
+        # suspend repaints so the widget batch below relayouts and paints once
+        self.setUpdatesEnabled(False)
+        try:
+            # Settings option in menu
+            self.preferencesAction.setDisabled(False)
+            # Connect button
+            self.connectButton.setVisible(True)
+            self.connectButton.setDisabled(False)
+            self.connectButton.setStyleSheet(self.styleGreen)
+            # Disconnect button
+            self.disconnectButton.setVisible(False)
+            self.disconnectButton.setDisabled(True)
+            self.disconnectButton.setStyleSheet(self.styleDisabled)
+            # Setup CP button
+            self.cpSetupButton.setVisible(False)
+            self.cpSetupButton.setDisabled(True)
+            self.cpSetupButton.setStyleSheet(self.styleDisabled)
+            # CP Automated Capture button
+            self.cpAutoCaptureButton.setVisible(False)
+            self.cpAutoCaptureButton.setDisabled(True)
+            self.cpAutoCaptureButton.setStyleSheet(self.styleDisabled)
+            # Manual capture button
+            self.manualCPCaptureButton.setVisible(False)
+            self.manualCPCaptureButton.setDisabled(True)
+            self.manualCPCaptureButton.setStyleSheet(self.styleDisabled)
+            # Start Alignment button
+            self.startAlignToolsButton.setVisible(False)
+            self.startAlignToolsButton.setDisabled(True)
+            self.startAlignToolsButton.setText('Align Tools')
+            self.startAlignToolsButton.setStyleSheet(self.styleDisabled)
+            # Override Manual Tool offset Capture button
+            self.overrideManualOffsetCaptureButton.setVisible(False)
+            self.overrideManualOffsetCaptureButton.setDisabled(True)
+            self.overrideManualOffsetCaptureButton.setStyleSheet(self.styleDisabled)
+            # Manual Tool offset Capture button
+            self.manualToolOffsetCaptureButton.setDisabled(True)
+            self.manualToolOffsetCaptureButton.setVisible(False)
+            self.manualToolOffsetCaptureButton.setStyleSheet(self.styleDisabled)
+            # Resume auto alignment button
+            self.resumeAutoToolAlignmentButton.setVisible(False)
+            self.resumeAutoToolAlignmentButton.setDisabled(True)
+            self.resumeAutoToolAlignmentButton.setStyleSheet(self.styleDisabled)
+            # Delete tool buttons
+            count = self.jogPanel.count()
+            for i in range(11,count):
+                item = self.jogPanel.itemAt(i)
+                widget = item.widget()
+                widget.setVisible(False)
+                # widget.deleteLater()
+            self.resetCalibration()
+            # Crosshair display button
+            self.crosshairDisplayButton.setVisible(True)
+            self.crosshairDisplayButton.setDisabled(False)
+            if(self.__displayCrosshair):
+                self.crosshairDisplayButton.setStyleSheet(self.styleOrange)
+                self.crosshairDisplayButton.setChecked(True)
+            else:
+                self.crosshairDisplayButton.setStyleSheet(self.styleBlue)
+                self.crosshairDisplayButton.setChecked(False)
+            # Jog panel tab
+            self.tabPanel.setDisabled(True)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.repaint()
 
     def stateConnected(self):
         # Settings option in menu
@@ -927,7 +874,7 @@ class App(QMainWindow):
         self.toolButtons = []
         self.toolCheckboxes = []
         # highest tool number storage
-        numTools = max(self.__activePrinter['tools'], key= lambda x:int(x['number']))['number']
+        numTools = max(int(tool['number']) for tool in self.__activePrinter['tools'])
         _logger.debug('Highest tool number is: ' + str(numTools))
         # Delete old toolbuttons, if they exist
         # Delete tool buttons
@@ -936,53 +883,60 @@ class App(QMainWindow):
             item = self.jogPanel.itemAt(i)
             widget = item.widget()
             widget.deleteLater()
-        currentTool = 0
-        for tool in range(numTools+1):
+        # only create widgets for tools that actually exist on the machine
+        for toolData in self.__activePrinter['tools']:
+            tool = int(toolData['number'])
             # add tool buttons
             toolButton = QPushButton('T' + str(tool))
             toolButton.setObjectName('toolButton_'+str(tool))
+            # stash the tool number on the button so click handlers don't re-parse the name
+            toolButton.setProperty('toolIndex', tool)
             toolButton.setFixedSize(self.pushbuttonSize,self.pushbuttonSize)
             toolButton.clicked.connect(self.identifyToolButton)
-            # check if current index exists in tool numbers from machine
-            if(any(d.get('number', -1) == tool for d in self.__activePrinter['tools'])):
-                toolTip = 'Fetch T' +  str(tool) + ' to current machine position.'
-                toolTip += '<pre>'
-                toolTip += 'X: ' + "{:>9.3f}".format(self.__activePrinter['tools'][currentTool]['offsets'][0])
-                toolTip += '<br>'
-                toolTip += 'Y: ' + "{:>9.3f}".format(self.__activePrinter['tools'][currentTool]['offsets'][1])
-                toolTip += '<br>'
-                toolTip += 'Z: ' + "{:>9.3f}".format(self.__activePrinter['tools'][currentTool]['offsets'][2])
-                toolTip += '</pre>'
-                currentTool += 1
-                toolButton.setToolTip(toolTip)
-                self.toolButtons.append(toolButton)
-                # add tool checkboxes
-                toolCheckbox = QCheckBox()
-                toolCheckbox.setObjectName('toolCheckbox_' + str(tool))
-                toolCheckbox.setToolTip('Add T' +  str(tool) + ' to calibration.')
-                toolCheckbox.setChecked(True)
-                toolCheckbox.setCheckable(True)
-                toolCheckbox.setObjectName('toolCheckbox_' + str(tool))
-                self.toolCheckboxes.append(toolCheckbox)
-            
-        # Display tool buttons
-        for i,button in enumerate(self.toolButtons):
-            button.setCheckable(True)
-            index = button.objectName()
-            index = int(index[-1:])
-            if int(self.__activePrinter['currentTool']) == index:
-                button.setChecked(True)
-            else: 
-                button.setChecked(False)
-            # button.clicked.connect(self.callTool)
-            self.jogPanel.addWidget(button, (7+i), 0, Qt.AlignCenter|Qt.AlignHCenter)
-
-        # Display tool checkboxes
-        for i,checkbox in enumerate(self.toolCheckboxes):
-            checkbox.setCheckable(True)
-            checkbox.setChecked(True)
-            # button.clicked.connect(self.callTool)
-            self.jogPanel.addWidget(checkbox, (7+i), 1, Qt.AlignCenter|Qt.AlignHCenter)
+            toolTip = 'Fetch T' +  str(tool) + ' to current machine position.'
+            toolTip += '<pre>'
+            toolTip += 'X: ' + "{:>9.3f}".format(toolData['offsets'][0])
+            toolTip += '<br>'
+            toolTip += 'Y: ' + "{:>9.3f}".format(toolData['offsets'][1])
+            toolTip += '<br>'
+            toolTip += 'Z: ' + "{:>9.3f}".format(toolData['offsets'][2])
+            toolTip += '</pre>'
+            toolButton.setToolTip(toolTip)
+            self.toolButtons.append(toolButton)
+            # add tool checkboxes
+            toolCheckbox = QCheckBox()
+            toolCheckbox.setObjectName('toolCheckbox_' + str(tool))
+            toolCheckbox.setToolTip('Add T' +  str(tool) + ' to calibration.')
+            toolCheckbox.setChecked(True)
+            toolCheckbox.setCheckable(True)
+            self.toolCheckboxes.append(toolCheckbox)
+
+        # suspend repaints while the panel is repopulated so Qt relayouts once
+        panelWidget = self.jogPanel.parentWidget()
+        if(panelWidget is not None):
+            panelWidget.setUpdatesEnabled(False)
+        try:
+            # Display tool buttons
+            for i,button in enumerate(self.toolButtons):
+                button.setCheckable(True)
+                index = button.objectName()
+                index = int(index[-1:])
+                if int(self.__activePrinter['currentTool']) == index:
+                    button.setChecked(True)
+                else:
+                    button.setChecked(False)
+                # button.clicked.connect(self.callTool)
+                self.jogPanel.addWidget(button, (7+i), 0, Qt.AlignCenter|Qt.AlignHCenter)
+
+            # Display tool checkboxes
+            for i,checkbox in enumerate(self.toolCheckboxes):
+                checkbox.setCheckable(True)
+                checkbox.setChecked(True)
+                # button.clicked.connect(self.callTool)
+                self.jogPanel.addWidget(checkbox, (7+i), 1, Qt.AlignCenter|Qt.AlignHCenter)
+        finally:
+            if(panelWidget is not None):
+                panelWidget.setUpdatesEnabled(True)
         # Alignment/Detection state reset
         self.state = 0
         # Endstop calibration state flags
@@ -1111,62 +1065,68 @@ class App(QMainWindow):
         self.tabPanel.setDisabled(True)
 
     def stateCalibrateReady(self):
-        # Settings option in menu
-        self.preferencesAction.setDisabled(False)
-        # Connect button
-        self.connectButton.setVisible(False)
-        self.connectButton.setDisabled(True)
-        self.connectButton.setStyleSheet(self.styleDisabled)
-        # Disconnect button
-        self.disconnectButton.setVisible(True)
-        self.disconnectButton.setDisabled(False)
-        self.disconnectButton.setStyleSheet(self.styleRed)
-        self.disconnectButton.setText('C')
-        self.disconnectButton.setToolTip('Cancel..')
-        # Setup CP button
-        self.cpSetupButton.setVisible(True)
-        self.cpSetupButton.setDisabled(False)
-        self.cpSetupButton.setStyleSheet(self.styleBlue)
-        # CP Automated Capture button
-        self.cpAutoCaptureButton.setVisible(False)
-        self.cpAutoCaptureButton.setDisabled(True)
-        self.cpAutoCaptureButton.setStyleSheet(self.styleDisabled)
-        # Manual capture button
-        self.manualCPCaptureButton.setVisible(False)
-        self.manualCPCaptureButton.setDisabled(True)
-        self.manualCPCaptureButton.setStyleSheet(self.styleDisabled)
-        # Start Alignment button
-        self.startAlignToolsButton.setVisible(True)
-        self.startAlignToolsButton.setDisabled(False)
-        self.startAlignToolsButton.setText('Align Tools')
-        self.startAlignToolsButton.setStyleSheet(self.styleGreen)
-        # Override Manual Tool offset Capture button
-        self.overrideManualOffsetCaptureButton.setVisible(False)
-        self.overrideManualOffsetCaptureButton.setDisabled(True)
-        self.overrideManualOffsetCaptureButton.setStyleSheet(self.styleDisabled)
-        # Manual Tool offset Capture button
-        self.manualToolOffsetCaptureButton.setDisabled(True)
-        self.manualToolOffsetCaptureButton.setVisible(False)
-        self.manualToolOffsetCaptureButton.setStyleSheet(self.styleDisabled)
-        # Resume auto alignment button
-        self.resumeAutoToolAlignmentButton.setVisible(False)
-        self.resumeAutoToolAlignmentButton.setDisabled(True)
-        self.resumeAutoToolAlignmentButton.setStyleSheet(self.styleDisabled)
-        # Crosshair display button
-        self.crosshairDisplayButton.setVisible(True)
-        self.crosshairDisplayButton.setDisabled(False)
-        if(self.__displayCrosshair):
-            self.crosshairDisplayButton.setStyleSheet(self.styleOrange)
-            self.crosshairDisplayButton.setChecked(True)
-        else:
-            self.crosshairDisplayButton.setStyleSheet(self.styleBlue)
-            self.crosshairDisplayButton.setChecked(False)
-        # Jog panel tab
-        self.tabPanel.setDisabled(False)
-        # Tool buttons
-        for button in self.toolButtons:
-            button.setStyleSheet('')
-            button.setDisabled(False)
+        # suspend repaints so the widget batch below relayouts and paints once
+        self.setUpdatesEnabled(False)
+        try:
+            # Settings option in menu
+            self.preferencesAction.setDisabled(False)
+            # Connect button
+            self.connectButton.setVisible(False)
+            self.connectButton.setDisabled(True)
+            self.connectButton.setStyleSheet(self.styleDisabled)
+            # Disconnect button
+            self.disconnectButton.setVisible(True)
+            self.disconnectButton.setDisabled(False)
+            self.disconnectButton.setStyleSheet(self.styleRed)
+            self.disconnectButton.setText('C')
+            self.disconnectButton.setToolTip('Cancel..')
+            # Setup CP button
+            self.cpSetupButton.setVisible(True)
+            self.cpSetupButton.setDisabled(False)
+            self.cpSetupButton.setStyleSheet(self.styleBlue)
+            # CP Automated Capture button
+            self.cpAutoCaptureButton.setVisible(False)
+            self.cpAutoCaptureButton.setDisabled(True)
+            self.cpAutoCaptureButton.setStyleSheet(self.styleDisabled)
+            # Manual capture button
+            self.manualCPCaptureButton.setVisible(False)
+            self.manualCPCaptureButton.setDisabled(True)
+            self.manualCPCaptureButton.setStyleSheet(self.styleDisabled)
+            # Start Alignment button
+            self.startAlignToolsButton.setVisible(True)
+            self.startAlignToolsButton.setDisabled(False)
+            self.startAlignToolsButton.setText('Align Tools')
+            self.startAlignToolsButton.setStyleSheet(self.styleGreen)
+            # Override Manual Tool offset Capture button
+            self.overrideManualOffsetCaptureButton.setVisible(False)
+            self.overrideManualOffsetCaptureButton.setDisabled(True)
+            self.overrideManualOffsetCaptureButton.setStyleSheet(self.styleDisabled)
+            # Manual Tool offset Capture button
+            self.manualToolOffsetCaptureButton.setDisabled(True)
+            self.manualToolOffsetCaptureButton.setVisible(False)
+            self.manualToolOffsetCaptureButton.setStyleSheet(self.styleDisabled)
+            # Resume auto alignment button
+            self.resumeAutoToolAlignmentButton.setVisible(False)
+            self.resumeAutoToolAlignmentButton.setDisabled(True)
+            self.resumeAutoToolAlignmentButton.setStyleSheet(self.styleDisabled)
+            # Crosshair display button
+            self.crosshairDisplayButton.setVisible(True)
+            self.crosshairDisplayButton.setDisabled(False)
+            if(self.__displayCrosshair):
+                self.crosshairDisplayButton.setStyleSheet(self.styleOrange)
+                self.crosshairDisplayButton.setChecked(True)
+            else:
+                self.crosshairDisplayButton.setStyleSheet(self.styleBlue)
+                self.crosshairDisplayButton.setChecked(False)
+            # Jog panel tab
+            self.tabPanel.setDisabled(False)
+            # Tool buttons
+            for button in self.toolButtons:
+                button.setStyleSheet('')
+                button.setDisabled(False)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.repaint()
 
     def stateCalibtrateRunning(self):
         # Settings option in menu
@@ -1358,7 +1318,7 @@ class App(QMainWindow):
     def setupCPAutoCapture(self):
         # send calling to log
         _logger.debug('*** calling App.setupCPAutoCapture')
-        self.startTime = time.time()
+        self.startTime = time.monotonic()
         #################################### Camera Calibration
         # Update GUI state
         self.stateCPAuto()
@@ -1436,8 +1396,9 @@ class App(QMainWindow):
 
     # Function to reset calibrateTools variables
     def resetCalibrationVariables(self):
-        # Setup camera calibration move coordinates
-        self.calibrationCoordinates = [ [0,-0.5], [0.294,-0.405], [0.476,-0.155], [0.476,0.155], [0.294,0.405], [0,0.5], [-0.294,0.405], [-0.476,0.155], [-0.476,-0.155], [-0.294,-0.405] ]
+        # Camera calibration move coordinates are constant; reference the shared
+        # class-level array instead of rebuilding a list of lists on every reset
+        self.calibrationCoordinates = self.__calibrationCoordinates
         # reset all variables
         self.guessPosition  = [1,1]
         self.uv = [None, None]
@@ -1461,7 +1422,7 @@ class App(QMainWindow):
     def startAlignTools(self):
         # send calling to log
         _logger.debug('*** calling App.startAlignTools')
-        self.startTime = time.time()
+        self.startTime = time.monotonic()
         # start as automated alignment state
         self.__stateOverrideManualNozzleAlignment = False
         self.__stateAutoNozzleAlignment = True
@@ -1494,7 +1455,7 @@ class App(QMainWindow):
         for button in self.toolButtons:
             if button.objectName() != sender.objectName():
                 button.setChecked(False)
-        toolIndex = int(sender.objectName()[11:])
+        toolIndex = sender.property('toolIndex')
         if(toolIndex != int(self.__activePrinter['currentTool'])):
             self.updateStatusbarMessage('>>> Loading T' + str(toolIndex) + '.. >>>')
             self.callTool(toolIndex)
@@ -1511,13 +1472,15 @@ class App(QMainWindow):
         if(len(self.workingToolset)>0):
             # grab the first item in the list (FIFO)
             toolIndex = self.workingToolset[0]
-            _logger.info('Calibrating T' + str(toolIndex) +'..')
-            self.startAlignToolsButton.setText('Detecting T'+ str(toolIndex) +'..')
+            # stringify the tool number once for all the labels below
+            toolLabel = str(toolIndex)
+            _logger.info('Calibrating T' + toolLabel +'..')
+            self.startAlignToolsButton.setText('Detecting T'+ toolLabel +'..')
             # delete the tool from the list before processing it
             self.workingToolset.pop(0)
             # update toolButtons GUI to indiciate which tool we're working on
+            buttonName = 'toolButton_' + toolLabel
             for button in self.toolButtons:
-                buttonName = 'toolButton_' + str(toolIndex)
                 if(button.objectName() == buttonName):
                     button.setStyleSheet(self.styleOrange)
             self.resetCalibrationVariables()
@@ -1527,12 +1490,12 @@ class App(QMainWindow):
             # DetectionManager state flag
             self.toggleNozzleAutoDetectionSignal.emit(True)
             # Capture start time of tool calibration run
-            self.toolTime = time.time()
+            self.toolTime = time.monotonic()
             # Call tool and start calibration
             self.callTool(toolIndex)
         else:
             # entire list has been processed, output results
-            calibration_time = np.around(time.time() - self.startTime,1)
+            calibration_time = round(time.monotonic() - self.startTime,1)
             _logger.info('Calibration completed (' + str(calibration_time) + 's) with a resolution of ' + str(self.mpp) + '/pixel')
             # save to firmware
             self.saveOffsets()
@@ -1549,15 +1512,19 @@ class App(QMainWindow):
             if(runtime):
                 pass
         except:
-            runtime = time.time()
-        if(self.uv is not None):
-            if(self.uv[0] is not None and self.uv[1] is not None):
+            runtime = time.monotonic()
+        # bind per-step state to locals once instead of re-resolving the
+        # attribute and dict chains throughout the state machine
+        uv = self.uv
+        currentPosition = self.__currentPosition
+        if(uv is not None):
+            if(uv[0] is not None and uv[1] is not None):
                 # First calibration step
                 if(self.state == 0):
                     _logger.debug('*** State: ' + str(self.state) + ' Coords:' + str(self.__currentPosition) + ' UV: ' + str(self.uv) + ' old UV: ' + str(self.olduv))
                     self.updateStatusbarMessage('Calibrating camera step 0..')
                     if(self.olduv is not None):
-                        if(self.olduv[0] == self.uv[0] and self.olduv[1] == self.uv[1]):
+                        if(self.olduv[0] == uv[0] and self.olduv[1] == uv[1]):
                             self.repeatCounter += 1
                             if(self.repeatCounter > 5):
                                 self.nozzleDetectionFailed()
@@ -1568,12 +1535,12 @@ class App(QMainWindow):
                             return
                         else:
                             self.repeatCounter = 0
-                    self.olduv = self.uv
+                    self.olduv = uv
                     self.space_coordinates = []
                     self.camera_coordinates = []
 
-                    self.space_coordinates.append((self.__currentPosition['X'], self.__currentPosition['Y']))
-                    self.camera_coordinates.append((self.uv[0], self.uv[1]))
+                    self.space_coordinates.append((currentPosition['X'], currentPosition['Y']))
+                    self.camera_coordinates.append((uv[0], uv[1]))
 
                     # move carriage for calibration
                     self.offsetX = self.calibrationCoordinates[0][0]
@@ -1588,7 +1555,7 @@ class App(QMainWindow):
                     if(self.state != self.lastState and self.state < len(self.calibrationCoordinates)):
                         _logger.debug('*** State: ' + str(self.state) + ' Coords:' + str(self.__currentPosition) + ' UV: ' + str(self.uv) + ' old UV: ' + str(self.olduv))
                         if(self.olduv is not None):
-                            if(self.olduv[0] == self.uv[0] and self.olduv[1] == self.uv[1]):
+                            if(self.olduv[0] == uv[0] and self.olduv[1] == uv[1]):
                                 self.repeatCounter += 1
                                 if(self.repeatCounter > 10):
                                     self.nozzleDetectionFailed()
@@ -1601,13 +1568,13 @@ class App(QMainWindow):
                                 self.repeatCounter = 0
                         # Calculate mpp at first move
                         if(self.state == 1):
-                            self.mpp = np.around(0.5/self.getDistance(self.olduv[0],self.olduv[1],self.uv[0],self.uv[1]),3)
+                            self.mpp = round(0.5/self.getDistance(self.olduv[0],self.olduv[1],self.uv[0],self.uv[1]),3)
                         # save position as previous position
-                        self.olduv = self.uv
+                        self.olduv = uv
                         # save machine coordinates for detected nozzle
-                        self.space_coordinates.append((self.__currentPosition['X'], self.__currentPosition['Y']))
+                        self.space_coordinates.append((currentPosition['X'], currentPosition['Y']))
                         # save camera coordinates
-                        self.camera_coordinates.append((self.uv[0],self.uv[1]))
+                        self.camera_coordinates.append((uv[0], uv[1]))
 
                         # return carriage to relative center of movement
                         self.offsetX = (-1*self.offsetX)
@@ -1631,7 +1598,7 @@ class App(QMainWindow):
                 elif(self.state == len(self.calibrationCoordinates)):
                     # Camera calibration moves completed.
                     if(self.olduv is not None):
-                        if(self.olduv[0] == self.uv[0] and self.olduv[1] == self.uv[1]):
+                        if(self.olduv[0] == uv[0] and self.olduv[1] == uv[1]):
                             self.repeatCounter += 1
                             if(self.repeatCounter > 10):
                                 self.nozzleDetectionFailed()
@@ -1648,14 +1615,14 @@ class App(QMainWindow):
                     _logger.info(updateMessage)
                     
                     # save position as previous position
-                    self.olduv = self.uv
+                    self.olduv = uv
                     # save machine coordinates for detected nozzle
-                    self.space_coordinates.append((self.__currentPosition['X'], self.__currentPosition['Y']))
+                    self.space_coordinates.append((currentPosition['X'], currentPosition['Y']))
                     # save camera coordinates
-                    self.camera_coordinates.append((self.uv[0],self.uv[1]))
+                    self.camera_coordinates.append((uv[0], uv[1]))
                     
                     # calculate camera transformation matrix
-                    cameraCalibrationTime = np.around(time.time() - self.startTime,1)
+                    cameraCalibrationTime = round(time.monotonic() - self.startTime,1)
                     _logger.info('Camera calibrated (' + str(cameraCalibrationTime) + 's); aligning..')
                     
                     # Calculate transformation matrix
@@ -1664,8 +1631,8 @@ class App(QMainWindow):
                     
                     # define camera center in machine coordinate space
                     self.newCenter = self.transformMatrix.T @ np.array([0, 0, 0, 0, 0, 1])
-                    self.guessPosition[0]= np.around(self.newCenter[0],3)
-                    self.guessPosition[1]= np.around(self.newCenter[1],3)
+                    self.guessPosition[0]= round(self.newCenter[0],3)
+                    self.guessPosition[1]= round(self.newCenter[1],3)
                     _logger.info('Calibration positional guess: ' + str(self.guessPosition))
 
                     # Set next calibration variables state
@@ -1684,7 +1651,7 @@ class App(QMainWindow):
                         updateMessage = 'Tool ' + str(self.__activePrinter['currentTool']) + ' calibration step ' + str(self.calibrationMoves) + '.. (MPP=' + str(self.mpp) +')'
                     self.updateStatusbarMessage(updateMessage)
                     # if(self.olduv is not None):
-                    #     if(self.olduv[0] == self.uv[0] and self.olduv[1] == self.uv[1]):
+                    #     if(self.olduv[0] == uv[0] and self.olduv[1] == uv[1]):
                     #         # print('Repeating detection: ' + str(self.repeatCounter))
                     #         self.repeatCounter += 1
                     #         if(self.repeatCounter > 10):
@@ -1702,11 +1669,10 @@ class App(QMainWindow):
                     # increment moves counter
                     self.calibrationMoves += 1
                     # nozzle detected, frame rotation is set, start
-                    self.cx,self.cy = self.normalize_coords(self.uv)
-                    self.v = [self.cx**2, self.cy**2, self.cx*self.cy, self.cx, self.cy, 0]
-                    self.offsets = -1*(0.55*self.transformMatrix.T @ self.v)
-                    self.offsets[0] = np.around(self.offsets[0],3)
-                    self.offsets[1] = np.around(self.offsets[1],3)
+                    self.cx,self.cy = self.normalize_coords(uv)
+                    self.v = np.array([self.cx**2, self.cy**2, self.cx*self.cy, self.cx, self.cy, 0])
+                    # single vectorized matmul + rounding instead of per-element operations
+                    self.offsets = np.around(-0.55*(self.transformMatrix.T @ self.v), 3)
                     _logger.debug('*** State: ' + str(self.state) + ' retries: ' + str(self.retries) + ' X' + str(self.__currentPosition['X']) + ' Y' + str(self.__currentPosition['Y']) + ' UV: ' + str(self.uv) + ' old UV: ' + str(self.olduv) + ' Offsets: ' + str(self.offsets))
                     # Add rounding handling for endstop alignment
                     if(self.__stateEndstopAutoCalibrate):
@@ -1719,17 +1685,17 @@ class App(QMainWindow):
                         if(self.toolTime):
                             pass
                     except:
-                        self.toolTime = time.time()
+                        self.toolTime = time.monotonic()
 
                     # calculate current calibration cycle runtime
-                    runtime = np.around(time.time() - self.toolTime,1)
+                    runtime = round(time.monotonic() - self.toolTime,1)
                     # check if too much time has passed
                     if(runtime > 120 or self.calibrationMoves > 30):
                         print('Runtime:', runtime, ' moves: ', self.calibrationMoves)
                         self.retries = 10
                     # Otherwise, check if we're not aligned to the center
                     elif(self.offsets[0] != 0.0 or self.offsets[1] != 0.0):
-                        self.olduv = self.uv
+                        self.olduv = uv
                         params = {'position': {'X': self.offsets[0], 'Y': self.offsets[1]}, 'moveSpeed':1000}
                         self.moveRelativeSignal.emit(params)
                         _logger.debug('Calibration move X{0:-1.3f} Y{1:-1.3f} F1000 '.format(self.offsets[0],self.offsets[1]))
@@ -1749,9 +1715,9 @@ class App(QMainWindow):
                             self.toggleDetectionSignal.emit(False)
                             self.__displayCrosshair = False
                             # Set CP location
-                            self.__cpCoordinates['X'] = np.around(self.__currentPosition['X'],2)
-                            self.__cpCoordinates['Y'] = np.around(self.__currentPosition['Y'],2)
-                            self.__cpCoordinates['Z'] = np.around(self.__currentPosition['Z'],2)
+                            self.__cpCoordinates['X'] = round(self.__currentPosition['X'],2)
+                            self.__cpCoordinates['Y'] = round(self.__currentPosition['Y'],2)
+                            self.__cpCoordinates['Z'] = round(self.__currentPosition['Z'],2)
                             # Update GUI statusbar with CP coordinates and green status
                             self.cpLabel.setText('<b>CP:</b> <i>('+ str(self.__cpCoordinates['X']) + ', ' + str(self.__cpCoordinates['Y']) + ')</i>')
                             self.cpLabel.setStyleSheet(self.styleGreen)
@@ -1813,7 +1779,7 @@ class App(QMainWindow):
         self.uv = [None, None]
         self.olduv = [None, None]
         self.__stateAutoNozzleAlignment = True
-        self.toolTime = time.time()
+        self.toolTime = time.monotonic()
         self.resumeAutoToolAlignmentButton.setVisible(False)
         self.resumeAutoToolAlignmentButton.setDisabled(True)
         self.resumeAutoToolAlignmentButton.setStyleSheet(self.styleDisabled)
@@ -1874,8 +1840,10 @@ class App(QMainWindow):
     @pyqtSlot(object)
     def refreshImage(self, data):
         self.__mutex.lock()
+        # frame arrives as a QImage built on the detection thread; the QPixmap
+        # conversion has to happen here on the GUI thread
         frame = data[0]
-        self.image.setPixmap(frame)
+        self.image.setPixmap(QPixmap.fromImage(frame))
         self.__mutex.unlock()
         self.getVideoFrameSignal.emit()
 
@@ -1891,7 +1859,9 @@ class App(QMainWindow):
             errorMsg = 'Error sending message to statusbar.'
             _logger.error(errorMsg)
         self.__mutex.unlock()
-        app.processEvents()
+        # flush paints so the statusbar updates mid-calibration, but keep user
+        # input queued to avoid re-entering the state machine from a click
+        app.processEvents(QEventLoop.ExcludeUserInputEvents)
         # send exiting to log
         _logger.debug('*** exiting App.updateStatusbarMessage')
 
@@ -2150,11 +2120,22 @@ class App(QMainWindow):
     def registerActiveTool(self, toolIndex):
         self.__mutex.lock()
         self.__activePrinter['currentTool'] = toolIndex
-        for button in self.toolButtons:
-            if(button.objectName() != ('toolButton_'+str(toolIndex))):
-                button.setChecked(False)
-            else:
-                button.setChecked(True)
+        # block toggled signals and batch repaints so the whole row of buttons
+        # restyles in one pass instead of once per setChecked
+        panelWidget = self.jogPanel.parentWidget()
+        if(panelWidget is not None):
+            panelWidget.setUpdatesEnabled(False)
+        blockers = [QSignalBlocker(button) for button in self.toolButtons]
+        try:
+            for button in self.toolButtons:
+                if(button.objectName() != ('toolButton_'+str(toolIndex))):
+                    button.setChecked(False)
+                else:
+                    button.setChecked(True)
+        finally:
+            del blockers
+            if(panelWidget is not None):
+                panelWidget.setUpdatesEnabled(True)
         self.__mutex.unlock()
         if(self.__stateAutoNozzleAlignment is False and self.__stateOverrideManualNozzleAlignment is False and int(toolIndex) != -1):
             self.startAlignToolsButton.setVisible(False)
@@ -2318,7 +2299,7 @@ class App(QMainWindow):
                 toolTip += '</pre>'
                 button.setToolTip(toolTip)
         if(__continue is True):
-            toolCalibrationTime = np.around(time.time() - self.toolTime,1)
+            toolCalibrationTime = round(time.monotonic() - self.toolTime,1)
             successMsg = 'Tool ' + str(self.__activePrinter['currentTool']) + ': (X' + str(offsets['X']) + ', Y' + str(offsets['Y']) + ', Z' + str(offsets['Z']) + ') -- [' + str(toolCalibrationTime) + 's].'
             self.updateStatusbarMessage(successMsg)
             _logger.info(successMsg)
@@ -2401,22 +2382,28 @@ class App(QMainWindow):
     ########################################################################### Utilities
     def sanitizeURL(self, inputString='http://localhost'):
         _logger.debug('*** calling App.sanitizeURL')
-        _errCode = 0
-        _errMsg = ''
-        _printerURL = 'http://localhost'
-        u = urlparse(inputString)
-        if(u[0] ==''):
-            u = u._replace(scheme="http")
-        scheme = u[0]
-        if(scheme.lower() not in ['http','https']):
-            _errCode = 1
-            _errMsg = 'Invalid scheme. Please only use http/https connections.'
-        else:
-            if(u.netloc == ''):
-                _printerURL = u.scheme + '://' + u.path
+        # memoize per input string so connection dialog retries and repeated
+        # profile loads skip the re-parse entirely
+        try:
+            (_errCode, _errMsg, _printerURL) = self.__sanitizedURLCache[inputString]
+        except KeyError:
+            _errCode = 0
+            _errMsg = ''
+            _printerURL = 'http://localhost'
+            u = urlparse(inputString)
+            if(u[0] ==''):
+                u = u._replace(scheme="http")
+            scheme = u[0]
+            if(scheme.lower() not in ['http','https']):
+                _errCode = 1
+                _errMsg = 'Invalid scheme. Please only use http/https connections.'
             else:
-                _printerURL = u.geturl()
-        _logger.debug('Sanitized ' + inputString + ' to address: ' + _printerURL)
+                if(u.netloc == ''):
+                    _printerURL = u.scheme + '://' + u.path
+                else:
+                    _printerURL = u.geturl()
+            self.__sanitizedURLCache[inputString] = (_errCode, _errMsg, _printerURL)
+            _logger.debug('Sanitized ' + inputString + ' to address: ' + _printerURL)
         _logger.debug('*** exiting App.sanitizeURL')
         return(_errCode, _errMsg, _printerURL)
 
@@ -2425,7 +2412,7 @@ class App(QMainWindow):
         _logger.debug('*** calling App.saveUserSettings')
         try:
             # get default camera from user settings
-            cameraSet = False
+            cameraSet = any(camera.get('default') == 1 for camera in self.__userSettings['camera'])
             # new_video_src = 0
             # for camera in self.__userSettings['camera']:
             #     try:
@@ -2455,9 +2442,13 @@ class App(QMainWindow):
                 # except:
                 #     _logger.critical('Cannot load default camera source.')
             # Save settings to file
-            with open('./config/settings.json','w') as outputfile:
-                json.dump(self.__userSettings, outputfile)
-            
+            # serialize once and write in a single call instead of streaming
+            # fragments through the file object with json.dump; write to a
+            # temp file and rename so a crash mid-write can't corrupt settings
+            with open('./config/settings.json.tmp','w') as outputfile:
+                outputfile.write(json.dumps(self.__userSettings))
+            os.replace('./config/settings.json.tmp','./config/settings.json')
+
             _logger.info('User preferences saved to settings.json')
             self.updateStatusbarMessage('User preferences saved to settings.json')
             self.statusBar.setStyleSheet('')
@@ -2469,14 +2460,8 @@ class App(QMainWindow):
 
     def getDistance(self, x1, y1, x0, y0):
         _logger.debug('*** calling CalibrateNozzles.getDistance')
-        x1_float = float(x1)
-        x0_float = float(x0)
-        y1_float = float(y1)
-        y0_float = float(y0)
-        x_dist = (x1_float - x0_float) ** 2
-        y_dist = (y1_float - y0_float) ** 2
-        retVal = np.sqrt((x_dist + y_dist))
-        returnVal = np.around(retVal,3)
+        # math.hypot is a single C call; no NumPy ufunc dispatch for two scalars
+        returnVal = round(math.hypot(float(x1) - float(x0), float(y1) - float(y0)), 3)
         _logger.debug('*** exiting CalibrateNozzles.getDistance')
         return(returnVal)
 
@@ -2488,12 +2473,18 @@ class App(QMainWindow):
     def least_square_mapping(self,calibration_points):
         # Compute a 2x2 map from displacement vectors in screen space to real space.
         n = len(calibration_points)
-        real_coords, pixel_coords = np.empty((n,2)),np.empty((n,2))
-        for i, (r,p) in enumerate(calibration_points):
-            real_coords[i] = r
-            pixel_coords[i] = p
+        # one C-level copy of the ((real),(pixel)) pairs instead of a Python loop
+        points = np.asarray(calibration_points, dtype=np.float64)
+        real_coords, pixel_coords = points[:,0], points[:,1]
         x,y = pixel_coords[:,0],pixel_coords[:,1]
-        A = np.vstack([x**2,y**2,x * y, x,y,np.ones(n)]).T
+        # fill the design matrix column-wise rather than stacking six temporaries
+        A = np.empty((n,6))
+        A[:,0] = x*x
+        A[:,1] = y*y
+        A[:,2] = x*y
+        A[:,3] = x
+        A[:,4] = y
+        A[:,5] = 1.0
         transform = np.linalg.lstsq(A, real_coords, rcond = None)
         return transform[0], transform[1].mean()
 
@@ -2531,7 +2522,7 @@ class App(QMainWindow):
                 self.printerThread.wait(self.__printerManagerThreadWaitTime)
             except: pass
         except Exception:
-            _logger.critical('Close event error: \n' + traceback.format_exc())
+            _logger.critical('Close event error', exc_info=True)
         # Output farewell message
         print()
         print('Thank you for using TAMV!')
@@ -2541,6 +2532,12 @@ class App(QMainWindow):
 
     ########################################################################### First run setups
     def show(self):
+        super().show()
+        # let Qt flush the initial show/layout/paint events before spinning up the
+        # camera and printer worker threads, so the window appears immediately
+        QTimer.singleShot(0, self.startupModules)
+
+    def startupModules(self):
         self.createDetectionManagerThread()
         self.createPrinterManagerThread()
         _logger.info('Initialization complete.')
@@ -2548,7 +2545,10 @@ class App(QMainWindow):
         print()
         print('  Welcome to TAMV!')
         print()
-        super().show()
+        # the worker threads exist now, so start them from here - kicking
+        # startModules off in parallel from __main__ raced this deferred setup
+        # and could dereference self.detectionThread before it was created
+        self.startModules()
     
     def startModules(self):
         self.detectionThread.start(priority=QThread.TimeCriticalPriority)
@@ -2596,13 +2596,13 @@ if __name__=='__main__':
                 print('Unknown OS error while moving log file to new folder.')
                 print('Please move \"./TAMV.log\" to \"./log/TAMV.log\" and restart TAMV.')
                 raise SystemExit('Cannot move log file.')
-    fh = RotatingFileHandler('./log/TAMV.log',backupCount=1,maxBytes=1000000)
+    # delay=True defers opening the file until the first record is emitted
+    fh = RotatingFileHandler('./log/TAMV.log',backupCount=1,maxBytes=1000000,delay=True)
     if(args['debug']):
         fh.setLevel(logging.DEBUG)
     else:
         fh.setLevel(logging.INFO)
     fh.setFormatter(fileFormatter)
-    _logger.addHandler(fh)
     ### # console handler logging
     consoleFormatter = logging.Formatter(fmt='%(levelname)-9s: %(message)s')
     ch = logging.StreamHandler()
@@ -2611,8 +2611,13 @@ if __name__=='__main__':
     else:
         ch.setLevel(logging.INFO)
     ch.setFormatter(consoleFormatter)
-    _logger.addHandler(ch)
-    
+    ### # route records through an in-process queue so the camera and GUI
+    ### # threads never block on disk or terminal I/O while logging
+    logQueue = queue.Queue(-1)
+    logListener = QueueListener(logQueue, fh, ch, respect_handler_level=True)
+    _logger.addHandler(QueueHandler(logQueue))
+    logListener.start()
+
     ### # log startup messages
     print()
     _logger.warning('This is an alpha release. Always use only when standing next to your machine and ready to hit EMERGENCY STOP.')
@@ -2622,6 +2627,7 @@ if __name__=='__main__':
     app = QApplication(sys.argv)
     a = App()
     a.show()
-    t = threading.Thread(target=a.startModules)
-    t.start()
-    sys.exit(app.exec())
+    exitCode = app.exec()
+    # flush any queued log records before the interpreter exits
+    logListener.stop()
+    sys.exit(exitCode)
@@ -15,7 +15,6 @@
 # Requires Python3
 # from csv import excel_tab
 # from string import lower
-from http.client import *
 
 
 import logging
@@ -50,6 +49,8 @@ class FailedOffsetCapture(Error):
     pass
 class StatusException(Error):
     pass
+class StatusTimeoutException(Error):
+    pass
 class CoordinatesException(Error):
     pass
 class SetOffsetException(Error):
@@ -61,6 +62,14 @@ class HomingException(Error):
 class DuetSBCHandler(Error):
     pass
 
+#################################################################################################################################
+#################################################################################################################################
+# helper to format axis values for gcode commands
+# fixed 3 decimal places matches the Duet's 0.001mm resolution and avoids the
+# long shortest-repr strings str() produces for unrounded floats
+def _fmt(value):
+    return('{0:.3f}'.format(float(value)))
+
 #################################################################################################################################
 #################################################################################################################################
 # helper class for tool definition
@@ -113,6 +122,10 @@ class printerAPI:
     _responseTimeout = 5
     # flag to indicate if machine has been homed or not
     _homed = None
+    # short-lived getStatus cache so back-to-back probes share one HTTP request
+    _statusCacheValue = None
+    _statusCacheTime = 0
+    _statusCacheTTL = 0.2
     # Tools
     _tools = []
 
@@ -150,25 +163,32 @@ class printerAPI:
         self.retry = Retry(connect=3, backoff_factor=0.4)
         self.adapter = HTTPAdapter(max_retries=self.retry)
         self.session.mount('http://', self.adapter)
+        # endpoint URLs never change once the address and password are known,
+        # so build them once here instead of concatenating on every request
+        self._connectUrl = self._base_url + '/rr_connect?password=' + self._password
+        self._statusUrl = self._base_url + '/rr_status?type=2'
+        self._legacyStatusUrl = self._base_url + '/rr_status'
+        self._replyUrl = self._base_url + '/rr_reply'
+        self._gcodeUrl = self._base_url + '/rr_gcode?gcode='
+        self._disconnectUrl = self._base_url + '/rr_disconnect'
+        self._sbcConnectUrl = self._base_url + '/machine/connect?password=' + self._password
+        self._sbcStatusUrl = self._base_url + '/machine/status'
+        self._sbcCodeUrl = self._base_url + '/machine/code/'
         try:
             # check if its a Duet 2 board
             # Set up session using password
             if(self._password != "reprap"):
                 _logger.debug('Starting DuetWebAPI session..')
-                URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+                URL = self._connectUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
             
-            URL=(f'{self._base_url}'+'/rr_status?type=2')
+            URL = self._statusUrl
             r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
             if(r.ok):
-                j = json.loads(r.text)
+                j = json.loads(r.content)
             else: 
                 raise DuetSBCHandler
 
-            # Send reply to clear buffer
-            replyURL = (f'{self._base_url}'+'/rr_reply')
-            r = self.session.get(replyURL, timeout=(self._requestTimeout,self._responseTimeout))
-            
             # Get machine name
             self._name = j['name']
             # Setup tool definitions
@@ -202,17 +222,17 @@ class printerAPI:
             try:
                 _logger.debug('Trying to connect to Duet 3 board..')
                 # Set up session using password
-                URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+                URL = self._sbcConnectUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 # Get session key
-                r_obj = json.loads(r.text)
+                r_obj = json.loads(r.content)
                 self._sessionKey = r_obj['sessionKey']
                 self.session.headers = {'X-Session-Key': self._sessionKey }
                 
-                URL=(f'{self._base_url}'+'/machine/status')
+                URL = self._sbcStatusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 _logger.debug('Got reply, parsing again..')
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 _=j
                 firmwareName = j['boards'][0]['firmwareName']
                 firmwareVersion = j['boards'][0]['firmwareVersion']
@@ -325,40 +345,33 @@ class printerAPI:
                 # Start a connection
                 if(self._password != "reprap"):
                     _logger.debug('Starting DuetWebAPI session..')
-                    URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+                    URL = self._connectUrl
                     r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
 
                 # Wait for machine to be in idle state
-                while self.getStatus() not in "idle":
-                    _logger.debug('Machine not idle, sleeping 0.5 seconds.')
-                    time.sleep(0.5)
+                self.waitForIdle(pollInterval=0.5)
                 # Fetch machine data
-                URL=(f'{self._base_url}'+'/rr_status?type=2')
+                URL = self._statusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 ret=j['currentTool']
-
-                # Send reply to clear buffer
-                replyURL = (f'{self._base_url}'+'/rr_reply')
-                r = self.session.get(replyURL, timeout=(self._requestTimeout,self._responseTimeout))
-
-                _logger.debug('Found current tool: ' + str(ret))
+                _logger.debug('Found current tool: %s', ret)
                 return(ret)
             elif (self.pt == 3):
                 # Set up session using password
-                URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+                URL = self._sbcConnectUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 # Get session key
-                r_obj = json.loads(r.text)
+                r_obj = json.loads(r.content)
                 self._sessionKey = r_obj['sessionKey']
                 self.session.headers = {'X-Session-Key': self._sessionKey }
 
-                URL=(f'{self._base_url}'+'/machine/status')
+                URL = self._sbcStatusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 if 'result' in j: j = j['result']
                 ret=j['state']['currentTool']
-                _logger.debug('Found current tool: ' + str(ret))
+                _logger.debug('Found current tool: %s', ret)
                 return(ret)
             else:
                 # Unknown condition, raise error
@@ -389,42 +402,42 @@ class printerAPI:
     # Raises: 
     #   - FailedOffsetCapture: when cannot determine number of tools on machine
     def getToolOffset(self, toolIndex=0):
-        _logger.debug('Called getToolOffset: ' + str(toolIndex))
+        _logger.debug('Called getToolOffset: %s', toolIndex)
         try:
             if (self.pt == 3):
                 # Set up session using password
-                URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+                URL = self._sbcConnectUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 # Get session key
-                r_obj = json.loads(r.text)
+                r_obj = json.loads(r.content)
                 self._sessionKey = r_obj['sessionKey']
                 self.session.headers = {'X-Session-Key': self._sessionKey }
 
-                URL=(f'{self._base_url}'+'/machine/status')
+                URL = self._sbcStatusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 if 'result' in j: j = j['result']
                 ja=j['move']['axes']
                 jt=j['tools']
-                ret=json.loads('{}')
+                ret={}
                 to = jt[toolIndex]['offsets']
                 for i in range(0,len(to)):
                     ret[ ja[i]['letter'] ] = to[i]
-                _logger.debug('Tool offset for T' + str(toolIndex) +': ' + str(ret))
+                _logger.debug('Tool offset for T%s: %s', toolIndex, ret)
                 return(ret)
             elif (self.pt == 2):
                 # Start a connection
                 if(self._password != "reprap"):
                     _logger.debug('Starting DuetWebAPI session..')
-                    URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+                    URL = self._connectUrl
                     r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
 
-                URL=(f'{self._base_url}'+'/rr_status?type=2')
+                URL = self._statusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 ja=j['axisNames']
                 jt=j['tools']
-                ret=json.loads('{}')
+                ret={}
                 for currentTool in jt:
                     if(currentTool['number'] == int(toolIndex)):
                         ret['X'] = currentTool['offsets'][0]
@@ -436,12 +449,7 @@ class printerAPI:
                 # to = jt[toolIndex]['offsets']
                 # for i in range(0,len(to)):
                     # ret[ ja[i] ] = to[i]
-                _logger.debug('Tool offset for T' + str(toolIndex) +': ' + str(ret))
-                
-                # Send reply to clear buffer
-                replyURL = (f'{self._base_url}'+'/rr_reply')
-                r = self.session.get(replyURL, timeout=(self._requestTimeout,self._responseTimeout))
-
+                _logger.debug('Tool offset for T%s: %s', toolIndex, ret)
                 return(ret)
             else:
                 raise FailedOffsetCapture('getG10ToolOffset entered unhandled exception state.')
@@ -474,30 +482,34 @@ class printerAPI:
     #   - StatusTimeoutException: when machine takes longer than _toolTimeout seconds to respond
     def getStatus(self):
         _logger.debug('Called getStatus')
+        # consecutive status probes within the TTL (e.g. isIdle followed by a
+        # waitForIdle check in the same operation) reuse the last fetched state
+        if(self._statusCacheValue is not None and time.monotonic() - self._statusCacheTime < self._statusCacheTTL):
+            return self._statusCacheValue
         try:
             if (self.pt == 2):
                 # Start a connection
                 if(self._password != "reprap"):
                     _logger.debug('Starting DuetWebAPI session..')
-                    URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+                    URL = self._connectUrl
                     r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
 
-                URL=(f'{self._base_url}'+'/rr_status')
+                URL = self._legacyStatusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 _status=j['status']
             elif (self.pt == 3):
                 # Set up session using password
-                URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+                URL = self._sbcConnectUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 # Get session key
-                r_obj = json.loads(r.text)
+                r_obj = json.loads(r.content)
                 self._sessionKey = r_obj['sessionKey']
                 self.session.headers = {'X-Session-Key': self._sessionKey }
 
-                URL=(f'{self._base_url}'+'/machine/status')
+                URL = self._sbcStatusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 if 'result' in j: 
                     j = j['result']
                 _status = str(j['state']['status'])
@@ -514,13 +526,16 @@ class printerAPI:
             # Handle return mapping of status variable "_status"
             if (_status == "idle" or _status == "I"):
                 _logger.debug("Machine is idle.")
-                return ("idle")
+                mappedStatus = "idle"
             elif (_status == "paused" or _status == "S" or _status == "pausing" or _status == "D"):
                 _logger.debug("Machine is paused.")
-                return ("paused")
+                mappedStatus = "paused"
             else:
                 _logger.debug("Machine is busy processing something.")
-                return ("processing")
+                mappedStatus = "processing"
+            self._statusCacheValue = mappedStatus
+            self._statusCacheTime = time.monotonic()
+            return (mappedStatus)
         except ConnectTimeoutError:
             errorMsg = 'getStatus: Connection timed out.'
             _logger.error(errorMsg)
@@ -535,15 +550,48 @@ class printerAPI:
             _logger.critical('Unhandled exception in getStatus: ' + str(e1))
             raise Exception(e1)
 
+    #################################################################################################################################
+    # Wait for machine to return to the idle state, polling at a fixed interval
+    # Parameters:
+    #   - pollInterval (float): seconds to sleep between status polls
+    #   - timeout (float): maximum seconds to wait, or None to wait indefinitely
+    #
+    # Returns: boolean
+    #   - True: machine reached the idle state
+    #
+    # Raises:
+    #   - StatusTimeoutException: when a timeout was requested and expired while
+    #     the machine was still busy
+    def waitForIdle(self, pollInterval=0.3, timeout=None):
+        _logger.debug('Called waitForIdle')
+        waitTimer = 0
+        delay = pollInterval
+        # equality, not substring containment: 'not in "idle"' would treat
+        # partial strings like 'id' as idle
+        while self.getStatus() != "idle":
+            # a toolchange or heat-soak macro can easily run for minutes, so by
+            # default keep waiting like the old inline idle loops did; callers
+            # that want to bound the wait pass a timeout and get an exception
+            # instead of a silently ignorable return value
+            if(timeout is not None and waitTimer >= timeout):
+                _logger.error('waitForIdle: machine still busy after ' + str(timeout) + ' seconds.')
+                raise StatusTimeoutException('Machine still busy after ' + str(timeout) + ' seconds.')
+            time.sleep(delay)
+            waitTimer += delay
+            # back off while the machine stays busy - long operations like
+            # homing don't need a status request every pollInterval seconds
+            delay = min(delay * 1.5, 1.0)
+        return(True)
+
     #################################################################################################################################
     # Get current tool coordinates from machine in XYZ space
     # Parameters:
     #   - NONE
     #
-    # Returns: 
+    # Returns:
     #   - tuple of floats: { 'X': 0.000 , 'Y': 0.000 , 'Z': 0.000 }
     #
-    # Raises: 
+    # Raises:
     #   - CoordinatesException: when cannot determine machine status
     def getCoordinates(self):
         _logger.debug('*** Called getCoordinates')
@@ -552,53 +600,43 @@ class printerAPI:
                 # Start a connection
                 if(self._password != "reprap"):
                     _logger.debug('Starting DuetWebAPI session..')
-                    URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+                    URL = self._connectUrl
                     r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
 
                 # poll machine for coordinates
-                while self.getStatus() not in "idle":
-                    _logger.debug('moveAbsolute: sleeping 0.3 seconds..')
-                    time.sleep(0.3)
+                self.waitForIdle()
                 
-                URL=(f'{self._base_url}'+'/rr_status?type=2')
+                URL = self._statusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 if not r.ok:
                     raise ConnectionError('Error in getCoordinates session 2: ' + str(r))
-                j = json.loads(r.text)
-                jc=j['coords']['xyz']
-                an=j['axisNames']
-                ret=json.loads('{}')
-                for i in range(0,len(jc)):
-                    ret[ an[i] ] = jc[i]
-                
+                j = json.loads(r.content)
+                ret = dict(zip(j['axisNames'], j['coords']['xyz']))
+
                 # Send reply to clear buffer
                 #replyURL = (f'{self._base_url}'+'/rr_reply')
                 #r = self.session.get(replyURL, timeout=(self._requestTimeout,self._responseTimeout))
                 _logger.debug('*** exiting getCoordinates')
                 return(ret)
             elif (self.pt == 3):
-                while self.getStatus() not in "idle":
-                    _logger.debug('XX - printer not idle _SLEEPING_')
-                    time.sleep(0.5)
+                self.waitForIdle(pollInterval=0.5)
                 # Set up session using password
-                URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+                URL = self._sbcConnectUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 # Get session key
-                r_obj = json.loads(r.text)
+                r_obj = json.loads(r.content)
                 self._sessionKey = r_obj['sessionKey']
                 self.session.headers = {'X-Session-Key': self._sessionKey }
 
-                URL=(f'{self._base_url}'+'/machine/status')
+                URL = self._sbcStatusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 if not r.ok:
                     raise ConnectionError('Error in getCoordinates session 3: ' + str(r))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 if 'result' in j: j = j['result']
                 ja=j['move']['axes']
-                ret=json.loads('{}')
-                for i in range(0,len(ja)):
-                    ret[ ja[i]['letter'] ] = ja[i]['userPosition']
-                _logger.debug('Returning coordinates: ' + str(ret))
+                ret = { axis['letter']: axis['userPosition'] for axis in ja }
+                _logger.debug('Returning coordinates: %s', ret)
                 _logger.debug('*** exiting getCoordinates')
                 return(ret)
             else:
@@ -631,7 +669,7 @@ class printerAPI:
     # Raises: 
     #   - SetOffsetException: when failed to set offsets in controller
     def setToolOffsets(self, tool=None, X=None, Y=None, Z=None):
-        _logger.debug('Called setToolOffsets: ' + str(tool))
+        _logger.debug('Called setToolOffsets: %s', tool)
         try:
             # Check for invalid tool index, raise exception if needed.
             if(tool is None):
@@ -642,11 +680,11 @@ class printerAPI:
             else:
                 offsetCommand = "G10 P" + str(int(tool))
                 if(X is not None):
-                    offsetCommand += " X" + str(X)
+                    offsetCommand += " X" + _fmt(X)
                 if(Y is not None):
-                    offsetCommand += " Y" + str(Y)
+                    offsetCommand += " Y" + _fmt(Y)
                 if(Z is not None):
-                    offsetCommand += " Z" + str(Z)
+                    offsetCommand += " Z" + _fmt(Z)
                 _logger.debug(offsetCommand)
                 self.gCode(offsetCommand)
                 _logger.debug("Tool offsets applied.")
@@ -691,34 +729,31 @@ class printerAPI:
                 # Start a connection
                 if(self._password != "reprap"):
                     _logger.debug('Starting DuetWebAPI session..')
-                    URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+                    URL = self._connectUrl
                     r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
 
-                URL=(f'{self._base_url}'+'/rr_status?type=2')
+                URL = self._statusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 axesList=j['coords']['axesHomed']
                 for axis in axesList:
                     if(axis == 0):
                         machineHomed = False
                     else:
                         pass
-                # Send reply to clear buffer
-                replyURL = (f'{self._base_url}'+'/rr_reply')
-                r = self.session.get(replyURL, timeout=(self._requestTimeout,self._responseTimeout))
             elif (self.pt == 3):
                 # Duet RRF v3
                 # Set up session using password
-                URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+                URL = self._sbcConnectUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 # Get session key
-                r_obj = json.loads(r.text)
+                r_obj = json.loads(r.content)
                 self._sessionKey = r_obj['sessionKey']
                 self.session.headers = {'X-Session-Key': self._sessionKey }
 
-                URL=(f'{self._base_url}'+'/machine/status')
+                URL = self._sbcStatusUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-                j = json.loads(r.text)
+                j = json.loads(r.content)
                 axesList=j['move']['axes']
                 for axis in axesList[0:3]:
                     if(axis['homed'] is False):
@@ -753,7 +788,7 @@ class printerAPI:
     # Raises: 
     #   - ToolTimeoutException: machine took too long to load the tool
     def loadTool(self, toolIndex = 0):
-        _logger.debug('Called loadTool: ' + str(toolIndex)) 
+        _logger.debug('Called loadTool: %s', toolIndex)
         # variable to hold current tool loading "virtual" timer
         toolchangeTimer = 0
         try:
@@ -854,11 +889,11 @@ class printerAPI:
                 moveCommand = "G91 G1 "
             # Add each axis position according to passed arguments
             if(X is not None):
-                moveCommand += " X" + str(X)
+                moveCommand += " X" + _fmt(X)
             if(Y is not None):
-                moveCommand += " Y" + str(Y)
+                moveCommand += " Y" + _fmt(Y)
             if(Z is not None):
-                moveCommand += " Z" + str(Z)
+                moveCommand += " Z" + _fmt(Z)
 
             # Add move speed to command
             moveCommand += " F" + str(moveSpeed) 
@@ -867,9 +902,7 @@ class printerAPI:
             _logger.debug(moveCommand)
             # Send command to machine
             self.gCode(moveCommand)
-            while self.getStatus() not in "idle":
-                _logger.debug('moveRelative: sleeping 0.3 seconds..')
-                time.sleep(0.3)
+            self.waitForIdle()
         except ConnectTimeoutError:
             errorMsg = 'moveRelative: Connection timed out.'
             _logger.error(errorMsg)
@@ -920,11 +953,11 @@ class printerAPI:
                 moveCommand = "G90 G1"
             # Add each axis position according to passed arguments
             if(X is not None):
-                moveCommand += " X" + str(X)
+                moveCommand += " X" + _fmt(X)
             if(Y is not None):
-                moveCommand += " Y" + str(Y)
+                moveCommand += " Y" + _fmt(Y)
             if(Z is not None):
-                moveCommand += " Z" + str(Z)
+                moveCommand += " Z" + _fmt(Z)
 
             # Add move speed to command
             moveCommand += " F" + str(moveSpeed) 
@@ -933,9 +966,7 @@ class printerAPI:
             _logger.debug(moveCommand)
             # Send command to machine
             self.gCode(moveCommand)
-            while self.getStatus() not in "idle":
-                _logger.debug('moveAbsolute: sleeping 0.3 seconds..')
-                time.sleep(0.3)
+            self.waitForIdle()
         except ConnectTimeoutError:
             errorMsg = 'moveAbsolute: Connection timed out.'
             _logger.error(errorMsg)
@@ -1057,31 +1088,33 @@ class printerAPI:
     #   - gCodeBatch: send an array of gcode strings to your controller and execute them sequentially 
 
     def gCode(self,command):
-        _logger.debug('gCode called: ' + command)
+        _logger.debug('gCode called: %s', command)
+        # invalidate cached machine status - the command may change machine state
+        self._statusCacheValue = None
         try:
             if (self.pt == 2):
                 # Start a connection
                 if(self._password != "reprap"):
                     _logger.debug('Starting DuetWebAPI session..')
-                    URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+                    URL = self._connectUrl
                     r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
 
-                URL=(f'{self._base_url}'+'/rr_gcode?gcode='+command)
+                URL = self._gcodeUrl + command
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 
                 # Send reply to clear buffer
-                replyURL = (f'{self._base_url}'+'/rr_reply')
+                replyURL = self._replyUrl
                 r2 = self.session.get(replyURL, timeout=(self._requestTimeout,self._responseTimeout))
             elif (self.pt == 3):
                 # Set up session using password
-                URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+                URL = self._sbcConnectUrl
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 # Get session key
-                r_obj = json.loads(r.text)
+                r_obj = json.loads(r.content)
                 self._sessionKey = r_obj['sessionKey']
                 self.session.headers = {'X-Session-Key': self._sessionKey }
 
-                URL=(f'{self._base_url}'+'/machine/code/')
+                URL = self._sbcCodeUrl
                 r = self.session.post(URL, data=command)
             if (r.ok):
                 return 0
@@ -1100,36 +1133,38 @@ class printerAPI:
             return -1
     
     def gCodeBatch(self,commands):
-        if(self.pt == 2): 
+        # invalidate cached machine status - the commands may change machine state
+        self._statusCacheValue = None
+        if(self.pt == 2):
             # Start a connection
             _logger.debug('Starting DuetWebAPI session..')
-            URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+            URL = self._connectUrl
             r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
         else:
             # Set up session using password
-            URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+            URL = self._sbcConnectUrl
             r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
             # Get session key
-            r_obj = json.loads(r.text)
+            r_obj = json.loads(r.content)
             self._sessionKey = r_obj['sessionKey']
             self.session.headers = {'X-Session-Key': self._sessionKey }
         
         for command in commands:
             if (self.pt == 2):
-                URL=(f'{self._base_url}'+'/rr_gcode?gcode='+command)
+                URL = self._gcodeUrl + command
                 r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
                 # Send reply to clear buffer
-                replyURL = (f'{self._base_url}'+'/rr_reply')
+                replyURL = self._replyUrl
                 r = self.session.get(replyURL, timeout=(self._requestTimeout,self._responseTimeout))
             if (self.pt == 3):
-                URL=(f'{self._base_url}'+'/machine/code/')
-                r = self.requests.post(URL, data=command)
+                URL = self._sbcCodeUrl
+                r = self.session.post(URL, data=command)
             if not (r.ok):
                 _logger.Error("Error in gCodeBatch command: " + str(r.status_code) + str(r.reason))
 
         if(self.pt == 2):
             #RRF 3 on a Duet Ethernet/Wifi board, apply buffer checking
-            endsessionURL = (f'{self._base_url}'+'/rr_disconnect')
+            endsessionURL = self._disconnectUrl
             r = self.session.get(endsessionURL, timeout=(self._requestTimeout,self._responseTimeout))
 
     #################################################################################################################################
@@ -1143,17 +1178,17 @@ class printerAPI:
         if (self.pt == 2):
             # Start a connection
             _logger.debug('Starting DuetWebAPI session..')
-            URL=(f'{self._base_url}'+'/rr_connect?password=' + self._password)
+            URL = self._connectUrl
             r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
         
             URL=(f'{self._base_url}'+'/rr_download?name='+filename)
 
         if (self.pt == 3):
             # Set up session using password
-            URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+            URL = self._sbcConnectUrl
             r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
             # Get session key
-            r_obj = json.loads(r.text)
+            r_obj = json.loads(r.content)
             self._sessionKey = r_obj['sessionKey']
             self.session.headers = {'X-Session-Key': self._sessionKey }
 
@@ -1219,7 +1254,7 @@ class printerAPI:
             if not self._rrf2:
                 #RRF 3 on a Duet Ethernet/Wifi board, apply buffer checking
                 _logger.debug('Starting DuetWebAPI session..')
-                sessionURL = (f'{self._base_url}'+'/rr_connect?password=' + self._password)
+                sessionURL = self._connectUrl
                 r = self.session.get(sessionURL, timeout=(self._requestTimeout,self._responseTimeout))
                 rawdata = r.json()
                 rawdata = json.dumps(rawdata)
@@ -1236,9 +1271,9 @@ class printerAPI:
                 #     if buffer_size < 150:
                 #         _logger.debug('Buffer low - adding 0.6s delay before next call: ' + str(buffer_size))
                 #         time.sleep(0.6)
-            URL=(f'{self._base_url}'+'/rr_gcode?gcode=G31')
+            URL = self._gcodeUrl + 'G31'
             r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
-            replyURL = (f'{self._base_url}'+'/rr_reply')
+            replyURL = self._replyUrl
             reply = self.session.get(replyURL, timeout=(self._requestTimeout,self._responseTimeout))
             # Reply is of the format:
             # "Z probe 0: current reading 0, threshold 500, trigger height 0.000, offsets X0.0 Y0.0 U0.0"
@@ -1247,19 +1282,19 @@ class printerAPI:
             triggerHeight = float(triggerHeight[:triggerHeight.find(',')])
             if not self._rrf2:
                 #RRF 3 on a Duet Ethernet/Wifi board, apply buffer checking
-                endsessionURL = (f'{self._base_url}'+'/rr_disconnect')
+                endsessionURL = self._disconnectUrl
                 r2 = self.session.get(endsessionURL, timeout=(self._requestTimeout,self._responseTimeout))
         if (self.pt == 3):
             # Set up session using password
-            URL=(f'{self._base_url}'+'/machine/connect?password=' + self._password)
+            URL = self._sbcConnectUrl
             r = self.session.get(URL, timeout=(self._requestTimeout,self._responseTimeout))
             # Get session key
-            r_obj = json.loads(r.text)
+            r_obj = json.loads(r.content)
             self._sessionKey = r_obj['sessionKey']
             self.session.headers = {'X-Session-Key': self._sessionKey }
 
-            URL=(f'{self._base_url}'+'/machine/code/')
-            r = self.requests.post(URL, data='G31')
+            URL = self._sbcCodeUrl
+            r = self.session.post(URL, data='G31')
             # Reply is of the format:
             # "Z probe 0: current reading 0, threshold 500, trigger height 0.000, offsets X0.0 Y0.0"
             reply = r.text
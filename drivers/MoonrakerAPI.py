@@ -12,7 +12,6 @@
 # Released under The MIT License. Full text available via https://opensource.org/licenses/MIT
 #
 # Requires Python3
-from csv import excel_tab
 import logging
 import requests
 from requests.adapters import HTTPAdapter
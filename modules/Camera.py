@@ -1,4 +1,3 @@
-from distutils.log import debug, error
 import logging
 # invoke parent (TAMV) _logger
 _logger = logging.getLogger('TAMV.CaptureManager.Camera')
@@ -60,10 +59,20 @@ class Camera(QtCore.QObject):
                 if(not self.__success):
                     _logger.debug('Camera API failover exploded')
                     raise Exception
+            # single-slot driver buffer so reads always return the newest frame
+            self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
+            # ask for MJPG so UVC cameras deliver full frame rate instead of the low-FPS YUYV default
+            self.cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
             self.cap.set(cv2.CAP_PROP_FRAME_WIDTH, self.__width)
             self.cap.set(cv2.CAP_PROP_FRAME_HEIGHT, self.__height)
             self.cap.set(cv2.CAP_PROP_FPS, 30)
-            self.cap.set(cv2.CAP_PROP_BUFFERSIZE,1)
+            # cache actual capture properties once, so later queries don't hit the device ioctls
+            try:
+                self.width = int(self.cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+                self.height = int(self.cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+                self.fps = int(self.cap.get(cv2.CAP_PROP_FPS))
+            except:
+                (self.width, self.height, self.fps) = (self.__width, self.__height, 30)
             # self.cap.setExceptionMode(enable=True)
             _logger.debug('Active CV backend: ' + self.cap.getBackendName())
             _logger.info('    .. camera connected using ' + self.cap.getBackendName() + '..')
@@ -110,14 +119,20 @@ class Camera(QtCore.QObject):
         _logger.debug('*** exiting Camera.__init__')
     
     def _reader(self):
+        failStreak = 0
         while True:
             ret = self.cap.grab()
             if not ret:
+                # tolerate transient grab failures before declaring the camera dead
+                failStreak += 1
+                if(failStreak < 3):
+                    continue
                 _logger.critical('Camera failed to grab a new frame.')
                 self.stop()
                 self.t.join()
                 self.cap.release()
                 break
+            failStreak = 0
             if self.stopEvent.is_set():
                 _logger.debug('Camera capture has been stopped.')
                 break
@@ -44,17 +44,18 @@ class ConnectionDialog(QDialog):
         self.printerCombobox = QComboBox()
         self.printerCombobox.setFixedWidth(280)
         self.printerCombobox.setStyleSheet('font: 16px')
-        self.defaultPrinter = {}
+        # the dialog only reads the settings to populate the combobox, so iterate
+        # the caller's profile list directly instead of copying it
+        defaultIndex = 0
         for i, device in enumerate(self.__settings['printer']):
             machineAddress = urlparse(device['address'])
             printerDescription = device['nickname'] + ' / ' + machineAddress.hostname
             if( device['default'] == 1 ):
-                self.defaultPrinter = device
-                self.defaultPrinter['index'] = i
+                defaultIndex = i
             self.printerCombobox.addItem(printerDescription)
         # handle selecting a new machine
         # set default printer as the selected index
-        self.printerCombobox.setCurrentIndex(self.defaultPrinter['index'])
+        self.printerCombobox.setCurrentIndex(defaultIndex)
         # add final option to add a new printer
         self.printerCombobox.addItem('+++ Add a new machine..')
         self.printerCombobox.currentIndexChanged.connect(self.addPrinter)
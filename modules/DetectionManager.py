@@ -5,10 +5,11 @@ _logger = logging.getLogger('TAMV.DetectionManager')
 
 import cv2
 import numpy as np
-from PyQt5.QtGui import QPixmap, QImage
+from PyQt5.QtGui import QImage
 from PyQt5.QtCore import pyqtSlot, QObject, pyqtSignal
-from time import sleep
-import copy, sys, multiprocessing
+import sys, multiprocessing
+import time
+import zlib
 
 class DetectionManager(QObject):
     # class attributes
@@ -23,6 +24,23 @@ class DetectionManager(QObject):
     __uv = None
     __counter = 0
     __algorithm = None
+    __gammaLUTs = {}
+    __crosshairOverlay = None
+    __crosshairMask = None
+    __grayScratch = None
+    __preprocessorOutputs = {}
+    __lastEndstopCenter = None
+    __morphKernel = np.ones((5,5), np.uint8)
+    __endstopBuffers = None
+    __lastEmitTime = 0.0
+    __minEmitInterval = 1/35
+    __lastFrameDigest = None
+    __lastQImage = None
+    # Format_BGR888 only exists in Qt 5.14+; the distro python3-pyqt5 that
+    # install_opencv.sh relies on (Ubuntu 20.04) ships Qt 5.12, so resolve it
+    # once here and fall back to a BGR->RGB conversion pass when it's missing
+    __qimageBGR888 = getattr(QImage, 'Format_BGR888', None)
+    __rgbScratch = None
     
     # Signals
     detectionManagerNewFrameSignal = pyqtSignal(object)
@@ -108,10 +126,18 @@ class DetectionManager(QObject):
         self.__contrastDefault = contrast
         self.__saturationDefault = staturation
         self.__hueDefault = hue
+        # cache actual capture dimensions and framerate reported by the camera process
+        try:
+            self.__frameSize['width'] = imageSettings['width']
+            self.__frameSize['height'] = imageSettings['height']
+            self.__fps = imageSettings['fps']
+        except KeyError:
+            self.__fps = None
         cameraProperties = {
             'videoSrc': self.__videoSource,
             'width': self.__frameSize['width'],
             'height': self.__frameSize['height'],
+            'fps': self.__fps,
             'image': {
                 'default': 1,
                 'brightness': self.__brightnessDefault,
@@ -175,6 +201,18 @@ class DetectionManager(QObject):
         self.detector = cv2.SimpleBlobDetector_create(self.standardParams)
         self.relaxedDetector = cv2.SimpleBlobDetector_create(self.relaxedParams)
 
+        # Fast variants for steady-state tracking: the blob detector runs one
+        # thresholding pass per step across [minThreshold, maxThreshold), so a
+        # coarser step cuts that sweep 5x. Once a detection combo is locked in,
+        # the nozzle is a strong single blob and the coarse sweep finds it just
+        # as reliably; the fine-step detectors handle the initial search.
+        self.standardParams.thresholdStep = 5
+        self.relaxedParams.thresholdStep = 5
+        self.fastDetector = cv2.SimpleBlobDetector_create(self.standardParams)
+        self.fastRelaxedDetector = cv2.SimpleBlobDetector_create(self.relaxedParams)
+        self.standardParams.thresholdStep = 1
+        self.relaxedParams.thresholdStep = 1
+
     def quit(self):
         # send calling to log
         _logger.debug('*** calling DetectionManager.quit')
@@ -248,14 +286,48 @@ class DetectionManager(QObject):
     def receivedFrame(self, frame):
         self.__counter += 1
         if(self.__running):
-            rgb_image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            h, w, ch = rgb_image.shape
-            bytes_per_line = ch * w
-            convert_to_Qt_format = QImage(rgb_image.data, w, h, bytes_per_line, QImage.Format_RGB888)
-            qpixmap = QPixmap.fromImage(convert_to_Qt_format)
+            # the video pipeline is a closed loop: App.refreshImage is what asks for
+            # the next frame, so every pass through here must emit *something* or
+            # the pump stalls for good. Skipped frames re-send the cached QImage
+            # (cheap - no conversion, no repaint of identical pixels on the GUI
+            # side) instead of returning early. The interval sits slightly below
+            # the camera's 30 fps period so normal timing jitter doesn't reject
+            # every other frame.
+            now = time.monotonic()
+            qimage = None
+            if(now - self.__lastEmitTime < self.__minEmitInterval):
+                qimage = self.__lastQImage
+            else:
+                self.__lastEmitTime = now
+                # skip the conversion when the picture hasn't changed, e.g.
+                # standby between tools; a subsampled checksum is enough. Like
+                # the limiter above, an unchanged frame still has to go around
+                # the loop - identical consecutive frames are routine when the
+                # machine sits idle, and returning here would end the feed
+                frameDigest = zlib.adler32(frame[::32,::32].tobytes())
+                if(frameDigest == self.__lastFrameDigest):
+                    qimage = self.__lastQImage
+                else:
+                    self.__lastFrameDigest = frameDigest
+            if(qimage is None):
+                h, w, ch = frame.shape
+                if(self.__qimageBGR888 is not None):
+                    # wrap the BGR frame directly - Format_BGR888 lets Qt do the
+                    # channel swap during paint, so no conversion pass is needed here
+                    convert_to_Qt_format = QImage(frame.data, w, h, frame.strides[0], self.__qimageBGR888)
+                else:
+                    # older Qt: convert into a reused scratch plane and hand Qt RGB888
+                    if(self.__rgbScratch is None or self.__rgbScratch.shape != frame.shape):
+                        self.__rgbScratch = np.empty_like(frame)
+                    rgbFrame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=self.__rgbScratch)
+                    convert_to_Qt_format = QImage(rgbFrame.data, w, h, rgbFrame.strides[0], QImage.Format_RGB888)
+                # deep-copy so the GUI thread owns its pixels independent of the working
+                # frame buffer; QPixmap creation itself belongs on the GUI thread
+                qimage = convert_to_Qt_format.copy()
+                self.__lastQImage = qimage
             try:
                 retObject = []
-                retObject.append(qpixmap)
+                retObject.append(qimage)
                 self.detectionManagerNewFrameSignal.emit(retObject)
             except: 
                 raise SystemExit('Fatal error in Detection Manager.')
@@ -304,34 +376,37 @@ class DetectionManager(QObject):
     def burstEndstopDetection(self):
         detectionCount = 0
         self.uv = [0, 0]
-        average_location=[0,0]
+        sumX = sumY = sumXX = sumYY = 0.0
         retries = 0
+        failed = False
         while(detectionCount < 5):
-            # for j in range(10):
-            #     self.frameEvent.set()
-            #     self.frame = self.pipeDM.recv()
-            #     self.frameEvent.clear()
+            # flush a couple of frames so detection runs against the newest capture
+            for j in range(2):
+                self.frameEvent.set()
+                self.frame = self.pipeDM.recv()
+                self.frameEvent.clear()
             (self.__uv, self.frame) = self.endstopContourDetection(self.frame)
-            if(self.__uv is not None):
-                if(self.__uv[0] is not None and self.__uv[1] is not None):
-                    average_location[0] += self.__uv[0]
-                    average_location[1] += self.__uv[1]
-                    detectionCount += 1
-                else:
-                    retries += 1
+            if(self.__uv is not None and self.__uv[0] is not None and self.__uv[1] is not None):
+                sumX += self.__uv[0]
+                sumY += self.__uv[1]
+                sumXX += self.__uv[0]*self.__uv[0]
+                sumYY += self.__uv[1]*self.__uv[1]
+                detectionCount += 1
+                # samples that already agree to sub-pixel variance won't move the
+                # average; stop sampling early instead of burning more frames
+                if(detectionCount >= 3):
+                    varX = sumXX/detectionCount - (sumX/detectionCount)**2
+                    varY = sumYY/detectionCount - (sumY/detectionCount)**2
+                    if(varX + varY < 0.25):
+                        break
             else:
                 retries += 1
             if(retries > 5):
-                average_location[0] = None
-                average_location[1] = None
+                failed = True
                 break
-        if(average_location[0] is not None):
-            # calculate average X Y position from detection
-            average_location[0] /= detectionCount
-            average_location[1] /= detectionCount
-            # round to 0 decimal places
-            average_location = np.around(average_location,0)
-            self.__uv = average_location
+        if(failed is False):
+            # calculate average X Y position from detection, rounded to 0 decimal places
+            self.__uv = np.around([sumX/detectionCount, sumY/detectionCount], 0)
         else:
             self.__uv = None
 
@@ -339,21 +414,31 @@ class DetectionManager(QObject):
         center = (None, None)
         if(self.__endstopAutomatedDetectionActive is True):
             # apply endstop detection algorithm
-            usedFrame = copy.deepcopy(detectFrame)
-            yuv = cv2.cvtColor(usedFrame, cv2.COLOR_BGR2YUV)
-            yuvPlanes = cv2.split(yuv)
-            still = yuvPlanes[0]
-            black = np.zeros((still.shape[0],still.shape[1]), np.uint8)
-            kernel = np.ones((5,5),np.uint8)
-            img_blur = cv2.GaussianBlur(still, (7, 7), 3)
-            img_canny = cv2.Canny(img_blur, 50, 190)
-            img_dilate = cv2.morphologyEx(img_canny, cv2.MORPH_DILATE, kernel, iterations=2)
-            cnt, hierarchy = cv2.findContours(img_dilate, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)
-            black = cv2.drawContours(black, cnt, -1, (255, 0, 255), -1)
-            black = cv2.morphologyEx(black, cv2.MORPH_DILATE, kernel, iterations=2)
-            cnt2, hierarchy2 = cv2.findContours(black, cv2.RETR_TREE, cv2.CHAIN_APPROX_NONE)
-            black = cv2.cvtColor(black, cv2.COLOR_GRAY2BGR)
-            # detectFrame = black
+            # BGR2GRAY produces the same Rec.601 luma as the Y plane of BGR2YUV in a
+            # single fused pass, without allocating the unused U and V planes; cvtColor
+            # only reads its input, so no defensive copy of the frame is needed either
+            still = cv2.cvtColor(detectFrame, cv2.COLOR_BGR2GRAY)
+            # once the endstop has been located, restrict the edge and morphology
+            # passes to a window around the last known center; fall back to the
+            # full frame on the first pass or whenever tracking loses the contour
+            roiOrigin = (0, 0)
+            if(self.__lastEndstopCenter is not None):
+                x0 = max(self.__lastEndstopCenter[0] - 200, 0)
+                y0 = max(self.__lastEndstopCenter[1] - 200, 0)
+                still = still[y0:y0+400, x0:x0+400]
+                roiOrigin = (x0, y0)
+            # reuse the blur/Canny/dilate/contour scratch planes between frames,
+            # reallocating only when the working shape changes (full frame vs ROI)
+            if(self.__endstopBuffers is None or self.__endstopBuffers[0].shape != still.shape):
+                self.__endstopBuffers = (np.empty_like(still), np.empty_like(still), np.empty_like(still), np.empty_like(still))
+            (blurBuffer, cannyBuffer, dilateBuffer, closeBuffer) = self.__endstopBuffers
+            img_blur = cv2.GaussianBlur(still, (7, 7), 3, dst=blurBuffer)
+            img_canny = cv2.Canny(img_blur, 50, 190, edges=cannyBuffer)
+            img_dilate = cv2.morphologyEx(img_canny, cv2.MORPH_DILATE, self.__morphKernel, dst=dilateBuffer, iterations=2)
+            # close the gaps in the edge band directly instead of filling every contour
+            # onto a blank canvas, re-dilating it and walking the contours a second time
+            img_closed = cv2.morphologyEx(img_dilate, cv2.MORPH_CLOSE, self.__morphKernel, dst=closeBuffer, iterations=2)
+            cnt2, hierarchy2 = cv2.findContours(img_closed, cv2.RETR_CCOMP, cv2.CHAIN_APPROX_SIMPLE)
             if len(cnt2) > 0:
                 myContours = []
                 for k in range(len(cnt2)):
@@ -363,9 +448,16 @@ class DetectionManager(QObject):
                     # return only the biggest detected contour
                     blobContours = max(myContours, key=lambda el: cv2.contourArea(el))
                     contourArea = cv2.contourArea(blobContours)
-                    if( len(blobContours) > 0 and contourArea >= 43000 and contourArea < 50000):
+                    # the historical 43000..50000 gate was tuned on the old fill+dilate
+                    # pipeline, which measured the blob's outer boundary ~8px outside the
+                    # Canny edge (4px edge-dilate band + 4px second dilate); the closed
+                    # band's hole contour sits ~4px inside it instead. A 12px radius
+                    # shift at this target size (r ~117-126px) is roughly 8-9k px^2 per
+                    # bound, giving 34500..41000. Derived geometrically - validate on
+                    # hardware and retune if the gate rejects a known-good endstop
+                    if( len(blobContours) > 0 and contourArea >= 34500 and contourArea < 41000):
                         M = cv2.moments(blobContours)
-                        center = (int(M["m10"] / M["m00"]), int(M["m01"] / M["m00"]))
+                        center = (int(M["m10"] / M["m00"]) + roiOrigin[0], int(M["m01"] / M["m00"]) + roiOrigin[1])
                         detectFrame = cv2.circle(detectFrame, center, 150, (255,0,0), 5,lineType=cv2.LINE_AA)
                         detectFrame = cv2.circle(detectFrame, center, 5, (255,0,255), 2,lineType=cv2.LINE_AA)
                         
@@ -373,25 +465,41 @@ class DetectionManager(QObject):
                         detectFrame = self.dashedLine(image=detectFrame, start=(0,240), end=(640,240), color=(0,0,0), horizontal=True, segmentWidth=4, lineWidth=2)
                         detectFrame = self.dashedLine(image=detectFrame, start=(320,0), end=(320,480), horizontal=False, segmentWidth=4, lineWidth=1)
                         detectFrame = self.dashedLine(image=detectFrame, start=(0,240), end=(640,240), horizontal=True, segmentWidth=4, lineWidth=1)
-                        
+            # remember where the endstop was for the next frame's ROI window
+            if(center[0] is not None):
+                self.__lastEndstopCenter = center
+            else:
+                self.__lastEndstopCenter = None
         else:
-            # draw crosshair
-            keypointRadius = 57
-            width = 4
-            detectFrame = self.dashedLine(image=detectFrame, start=(320,0), end=(320, 240-keypointRadius), color=(0,0,0), horizontal=False, lineWidth=2, segmentWidth=width)
-            detectFrame = self.dashedLine(image=detectFrame, start=(320,240+keypointRadius), end=(320,480), color=(0,0,0), horizontal=False, lineWidth=2, segmentWidth=width)
-            detectFrame = self.dashedLine(image=detectFrame, start=(320,0), end=(320, 240-keypointRadius), color=(255,255,255), horizontal=False, lineWidth=1, segmentWidth=width)
-            detectFrame = self.dashedLine(image=detectFrame, start=(320,240+keypointRadius), end=(320,480), color=(255,255,255), horizontal=False, lineWidth=1, segmentWidth=width)
-
-            detectFrame = self.dashedLine(image=detectFrame, start=(0,240), end=(320-keypointRadius, 240), color=(0,0,0), horizontal=True, lineWidth=2, segmentWidth=width)
-            detectFrame = self.dashedLine(image=detectFrame, start=(320+keypointRadius,240), end=(640,240), color=(0,0,0), horizontal=True, lineWidth=2, segmentWidth=width)
-            detectFrame = self.dashedLine(image=detectFrame, start=(0,240), end=(320-keypointRadius, 240), color=(255,255,255), horizontal=True, lineWidth=1, segmentWidth=width)
-            detectFrame = self.dashedLine(image=detectFrame, start=(320+keypointRadius,240), end=(640,240), color=(255,255,255), horizontal=True, lineWidth=1, segmentWidth=width)
-
-            detectFrame = cv2.circle(img=detectFrame, center=(320,240), radius=keypointRadius, color=(0,0,0), thickness=3,lineType=cv2.LINE_AA)
-            detectFrame = cv2.circle(img=detectFrame, center=(320,240), radius=keypointRadius+1, color=(0,0,255), thickness=1,lineType=cv2.LINE_AA)
+            # blit the cached crosshair overlay instead of re-drawing it per frame
+            if(self.__crosshairMask is None or self.__crosshairMask.shape[:2] != detectFrame.shape[:2]):
+                self.buildCrosshairOverlay(detectFrame.shape)
+            np.copyto(detectFrame, self.__crosshairOverlay, where=self.__crosshairMask)
         return(center,detectFrame)
 
+    def buildCrosshairOverlay(self, frameShape):
+        # the idle crosshair pattern is static, so render it once onto an
+        # overlay plus a boolean mask of the touched pixels
+        keypointRadius = 57
+        width = 4
+        overlay = np.zeros(frameShape, np.uint8)
+        mask = np.zeros(frameShape[:2], np.uint8)
+        for (canvas, blackColor, whiteColor, redColor) in ((overlay, (0,0,0), (255,255,255), (0,0,255)), (mask, 255, 255, 255)):
+            canvas = self.dashedLine(image=canvas, start=(320,0), end=(320, 240-keypointRadius), color=blackColor, horizontal=False, lineWidth=2, segmentWidth=width)
+            canvas = self.dashedLine(image=canvas, start=(320,240+keypointRadius), end=(320,480), color=blackColor, horizontal=False, lineWidth=2, segmentWidth=width)
+            canvas = self.dashedLine(image=canvas, start=(320,0), end=(320, 240-keypointRadius), color=whiteColor, horizontal=False, lineWidth=1, segmentWidth=width)
+            canvas = self.dashedLine(image=canvas, start=(320,240+keypointRadius), end=(320,480), color=whiteColor, horizontal=False, lineWidth=1, segmentWidth=width)
+
+            canvas = self.dashedLine(image=canvas, start=(0,240), end=(320-keypointRadius, 240), color=blackColor, horizontal=True, lineWidth=2, segmentWidth=width)
+            canvas = self.dashedLine(image=canvas, start=(320+keypointRadius,240), end=(640,240), color=blackColor, horizontal=True, lineWidth=2, segmentWidth=width)
+            canvas = self.dashedLine(image=canvas, start=(0,240), end=(320-keypointRadius, 240), color=whiteColor, horizontal=True, lineWidth=1, segmentWidth=width)
+            canvas = self.dashedLine(image=canvas, start=(320+keypointRadius,240), end=(640,240), color=whiteColor, horizontal=True, lineWidth=1, segmentWidth=width)
+
+            canvas = cv2.circle(img=canvas, center=(320,240), radius=keypointRadius, color=blackColor, thickness=3,lineType=cv2.LINE_AA)
+            canvas = cv2.circle(img=canvas, center=(320,240), radius=keypointRadius+1, color=redColor, thickness=1,lineType=cv2.LINE_AA)
+        self.__crosshairOverlay = overlay
+        self.__crosshairMask = mask.astype(bool)[:,:,None]
+
     @pyqtSlot(bool)
     def toggleEndstopDetection(self, endstopDetectFlag):
         if(endstopDetectFlag is True):
@@ -490,14 +598,20 @@ class DetectionManager(QObject):
 
     def nozzleDetection(self):
         # working frame object
-        nozzleDetectFrame = copy.deepcopy(self.frame)
+        # one flat ndarray copy to draw overlays on; deepcopy adds dispatch
+        # overhead for the same result on an image buffer
+        nozzleDetectFrame = self.frame.copy()
         # return value for keypoints
         keypoints = None
         center = (None, None)
         # check which algorithm worked previously
         if(self.__algorithm is None):
-            preprocessorImage0 = self.preprocessImage(frameInput=nozzleDetectFrame, algorithm=0)
-            preprocessorImage1 = self.preprocessImage(frameInput=nozzleDetectFrame, algorithm=1)
+            # gamma correction is shared by both preprocessors, so run it once per frame
+            try:
+                gammaFrame = self.adjust_gamma(image=nozzleDetectFrame, gamma=1.2)
+            except: gammaFrame = nozzleDetectFrame.copy()
+            preprocessorImage0 = self.preprocessImage(frameInput=gammaFrame, algorithm=0, gammaCorrected=True)
+            preprocessorImage1 = self.preprocessImage(frameInput=gammaFrame, algorithm=1, gammaCorrected=True)
 
             # apply combo 1 (standard detector, preprocessor 0)
             keypoints = self.detector.detect(preprocessorImage0)
@@ -527,31 +641,36 @@ class DetectionManager(QObject):
                 self.__algorithm = 1
         elif(self.__algorithm == 1):
             preprocessorImage0 = self.preprocessImage(frameInput=nozzleDetectFrame, algorithm=0)
-            keypoints = self.detector.detect(preprocessorImage0)
+            keypoints = self.fastDetector.detect(preprocessorImage0)
             keypointColor = (0,0,255)
         elif(self.__algorithm == 2):
             preprocessorImage1 = self.preprocessImage(frameInput=nozzleDetectFrame, algorithm=1)
-            keypoints = self.detector.detect(preprocessorImage1)
+            keypoints = self.fastDetector.detect(preprocessorImage1)
             keypointColor = (0,255,0)
         elif(self.__algorithm == 3):
             preprocessorImage0 = self.preprocessImage(frameInput=nozzleDetectFrame, algorithm=0)
-            keypoints = self.relaxedDetector.detect(preprocessorImage0)
+            keypoints = self.fastRelaxedDetector.detect(preprocessorImage0)
             keypointColor = (255,0,0)
         else:
             preprocessorImage1 = self.preprocessImage(frameInput=nozzleDetectFrame, algorithm=1)
-            keypoints = self.relaxedDetector.detect(preprocessorImage1)
+            keypoints = self.fastRelaxedDetector.detect(preprocessorImage1)
             keypointColor = (39,127,255)
+        if(self.__algorithm is not None and (keypoints is None or len(keypoints) == 0)):
+            # coarse tracking sweep missed; re-run the full fine-step cascade next frame
+            self.__algorithm = None
         # process keypoint
         if(keypoints is not None and len(keypoints) >= 1):
-            # create center object
-            (x,y) = np.around(keypoints[0].pt)
-            x,y = int(x), int(y)
+            # create center object; plain round() avoids NumPy scalar round-trips
+            # for what is two floats per frame
+            x = int(round(keypoints[0].pt[0]))
+            y = int(round(keypoints[0].pt[1]))
             center = (x,y)
             # create radius object
-            keypointRadius = np.around(keypoints[0].size/2)
-            keypointRadius = int(keypointRadius)
-            circleFrame = cv2.circle(img=nozzleDetectFrame, center=center, radius=keypointRadius,color=keypointColor,thickness=-1,lineType=cv2.LINE_AA)
-            nozzleDetectFrame = cv2.addWeighted(circleFrame, 0.4, nozzleDetectFrame, 0.6, 0)
+            keypointRadius = int(round(keypoints[0].size/2))
+            # cv2.circle draws in place, so the old addWeighted blended the frame with
+            # itself - a full-frame floating-point pass that changed nothing. Draw the
+            # filled marker directly and skip the blend.
+            nozzleDetectFrame = cv2.circle(img=nozzleDetectFrame, center=center, radius=keypointRadius,color=keypointColor,thickness=-1,lineType=cv2.LINE_AA)
             nozzleDetectFrame = cv2.circle(img=nozzleDetectFrame, center=center, radius=keypointRadius, color=(0,0,0), thickness=1,lineType=cv2.LINE_AA)
             nozzleDetectFrame = cv2.line(nozzleDetectFrame, (x-5,y), (x+5, y), (255,255,255), 2)
             nozzleDetectFrame = cv2.line(nozzleDetectFrame, (x,y-5), (x, y+5), (255,255,255), 2)
@@ -589,30 +708,49 @@ class DetectionManager(QObject):
     ##### Utilities
     # adjust image gamma
     def adjust_gamma(self, image, gamma=1.2):
-        # build a lookup table mapping the pixel values [0, 255] to
-        # their adjusted gamma values
-        invGamma = 1.0 / gamma
-        table = np.array([((i / 255.0) ** invGamma) * 255
-            for i in np.arange(0, 256)]).astype( 'uint8' )
+        # look up the precomputed table mapping the pixel values [0, 255] to
+        # their adjusted gamma values, building it only on first use per gamma
+        try:
+            table = self.__gammaLUTs[gamma]
+        except KeyError:
+            invGamma = 1.0 / gamma
+            table = (((np.arange(256) / 255.0) ** invGamma) * 255).astype('uint8')
+            self.__gammaLUTs[gamma] = table
         # apply gamma correction using the lookup table
         return cv2.LUT(image, table)
 
     # Image detection preprocessors
-    def preprocessImage(self, frameInput, algorithm=0):
+    def preprocessImage(self, frameInput, algorithm=0, gammaCorrected=False):
+        if(gammaCorrected is True):
+            # caller already applied gamma correction to this frame
+            outputFrame = frameInput
+        else:
+            try:
+                outputFrame = self.adjust_gamma(image=frameInput, gamma=1.2)
+            except: outputFrame = frameInput.copy()
+        # reuse scratch buffers across frames: the intermediate gray plane is shared,
+        # but each algorithm keeps its own output buffer so both preprocessor results
+        # can coexist within one detection cycle
+        if(self.__grayScratch is None or self.__grayScratch.shape != frameInput.shape[:2]):
+            self.__grayScratch = np.empty(frameInput.shape[:2], dtype=np.uint8)
+            self.__preprocessorOutputs = {}
         try:
-            outputFrame = self.adjust_gamma(image=frameInput, gamma=1.2)
-        except: outputFrame = copy.deepcopy(frameInput)
+            preprocessorOutput = self.__preprocessorOutputs[algorithm]
+        except KeyError:
+            preprocessorOutput = np.empty(frameInput.shape[:2], dtype=np.uint8)
+            self.__preprocessorOutputs[algorithm] = preprocessorOutput
         if(algorithm == 0):
-            yuv = cv2.cvtColor(outputFrame, cv2.COLOR_BGR2YUV)
-            yuvPlanes = cv2.split(yuv)
-            yuvPlanes[0] = cv2.GaussianBlur(yuvPlanes[0],(7,7),6)
-            yuvPlanes[0] = cv2.adaptiveThreshold(yuvPlanes[0],255,cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,35,1)
-            outputFrame = cv2.cvtColor(yuvPlanes[0],cv2.COLOR_GRAY2BGR)
+            # BGR2GRAY computes the same Rec.601 luma as the Y plane of BGR2YUV,
+            # without also computing and splitting off the unused U and V planes
+            luma = cv2.cvtColor(outputFrame, cv2.COLOR_BGR2GRAY, dst=self.__grayScratch)
+            cv2.GaussianBlur(luma,(7,7),6, dst=luma)
+            # stay single-channel: SimpleBlobDetector accepts grayscale input
+            outputFrame = cv2.adaptiveThreshold(luma,255,cv2.ADAPTIVE_THRESH_GAUSSIAN_C, cv2.THRESH_BINARY,35,1, dst=preprocessorOutput)
         elif(algorithm == 1):
-            outputFrame = cv2.cvtColor(outputFrame, cv2.COLOR_BGR2GRAY )
-            thr_val, outputFrame = cv2.threshold(outputFrame, 127, 255, cv2.THRESH_BINARY|cv2.THRESH_TRIANGLE )
-            outputFrame = cv2.GaussianBlur( outputFrame, (7,7), 6 )
-            outputFrame = cv2.cvtColor( outputFrame, cv2.COLOR_GRAY2BGR )
+            luma = cv2.cvtColor(outputFrame, cv2.COLOR_BGR2GRAY, dst=self.__grayScratch)
+            cv2.threshold(luma, 127, 255, cv2.THRESH_BINARY|cv2.THRESH_TRIANGLE, dst=luma )
+            # stay single-channel: SimpleBlobDetector accepts grayscale input
+            outputFrame = cv2.GaussianBlur( luma, (7,7), 6, dst=preprocessorOutput )
         return(outputFrame)
 
     ##### Image adjustment properties
@@ -654,6 +792,8 @@ class DetectionManager(QObject):
 def _reader(q, frameEvent, stopEvent, videoSrc, height, width, backend):
         cap = cv2.VideoCapture(videoSrc, backend)
         cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        # ask for MJPG so UVC cameras deliver full frame rate instead of the low-FPS YUYV default
+        cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
         cap.set(cv2.CAP_PROP_FRAME_HEIGHT, height)
         cap.set(cv2.CAP_PROP_FRAME_WIDTH, width)
         cap.setExceptionMode(enable=True)
@@ -663,12 +803,15 @@ def _reader(q, frameEvent, stopEvent, videoSrc, height, width, backend):
             if(not ret):
                 cap.release()
                 raise SystemError('Camera failure.')
-            # Get camera default settings
+            # Get camera default settings (queried once here so the GUI never has to hit the capture object)
             brightness = cap.get(cv2.CAP_PROP_BRIGHTNESS)
             contrast = cap.get(cv2.CAP_PROP_CONTRAST)
             saturation = cap.get(cv2.CAP_PROP_SATURATION)
             hue = cap.get(cv2.CAP_PROP_HUE)
-            cameraSettings = {'default': 1, 'brightness': brightness, 'contrast': contrast, 'saturation': saturation, 'hue': hue}
+            actualWidth = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+            actualHeight = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+            actualFPS = int(cap.get(cv2.CAP_PROP_FPS))
+            cameraSettings = {'default': 1, 'brightness': brightness, 'contrast': contrast, 'saturation': saturation, 'hue': hue, 'width': actualWidth, 'height': actualHeight, 'fps': actualFPS}
             # send default settings to queue
             q.send(cameraSettings)
         except Exception as e:
@@ -676,19 +819,26 @@ def _reader(q, frameEvent, stopEvent, videoSrc, height, width, backend):
             _logger.critical('Camera failed:' + str(e))
             stopEvent.set()
         FPS = 1/30
+        failStreak = 0
         while True:
             try:
                 ret = cap.grab()
             except: break
             if not ret:
-                break
+                # tolerate transient grab failures before declaring the camera dead
+                failStreak += 1
+                if(failStreak >= 3):
+                    break
+                continue
+            failStreak = 0
             if stopEvent.is_set():
                 break
             if frameEvent.is_set():
                 ret, frame = cap.retrieve()
                 q.send(frame)
-            # check for inputs
-            if(q.poll(FPS/2)):
+            # wait on the pipe for new image settings; the timeout doubles as
+            # the frame pacing interval, so no extra sleep is needed
+            if(q.poll(FPS)):
                 settings = q.recv()
                 try:
                     brightness = float(settings['brightness'])
@@ -709,7 +859,6 @@ def _reader(q, frameEvent, stopEvent, videoSrc, height, width, backend):
                     cap.set(cv2.CAP_PROP_HUE, hue)
                 except:
                     _logger.warning('Failed to set image properties')
-            sleep(FPS)
         cap.release()
         q.send(-1)
         q.close()
\ No newline at end of file
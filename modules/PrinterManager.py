@@ -237,9 +237,10 @@ class PrinterManager(QObject):
                 if(xPos is not None): self.__activePrinter.moveAbsolute(rapidMove=False, moveSpeed=moveSpeed, X=xPos)
                 if(zPos is not None): self.__activePrinter.moveAbsolute(rapidMove=False, moveSpeed=moveSpeed, Z=zPos)
             else:
-                # move X -> Y -> Z
-                if(xPos is not None): self.__activePrinter.moveAbsolute(rapidMove=False, moveSpeed=moveSpeed, X=xPos)
-                if(yPos is not None): self.__activePrinter.moveAbsolute(rapidMove=False, moveSpeed=moveSpeed, Y=yPos)
+                # move XY together in one gcode line, then Z
+                # (Z stays a separate move so the nozzle only plunges once in position)
+                if(xPos is not None or yPos is not None):
+                    self.__activePrinter.moveAbsolute(rapidMove=False, moveSpeed=moveSpeed, X=xPos, Y=yPos)
                 if(zPos is not None): self.__activePrinter.moveAbsolute(rapidMove=False, moveSpeed=moveSpeed, Z=zPos)
         except:
             errorMsg = 'Error performing printer moves.'
@@ -276,9 +277,10 @@ class PrinterManager(QObject):
                 if(xPos is not None): self.__activePrinter.moveRelative(rapidMove=False, moveSpeed=moveSpeed, X=xPos)
                 if(zPos is not None): self.__activePrinter.moveRelative(rapidMove=False, moveSpeed=moveSpeed, Z=zPos)
             else:
-                # move X -> Y -> Z
-                if(xPos is not None): self.__activePrinter.moveRelative(rapidMove=False, moveSpeed=moveSpeed, X=xPos)
-                if(yPos is not None): self.__activePrinter.moveRelative(rapidMove=False, moveSpeed=moveSpeed, Y=yPos)
+                # move XY together in one gcode line, then Z
+                # (Z stays a separate move so the nozzle only plunges once in position)
+                if(xPos is not None or yPos is not None):
+                    self.__activePrinter.moveRelative(rapidMove=False, moveSpeed=moveSpeed, X=xPos, Y=yPos)
                 if(zPos is not None): self.__activePrinter.moveRelative(rapidMove=False, moveSpeed=moveSpeed, Z=zPos)
         except:
             errorMsg = 'Error performing printer moves.'
@@ -3,10 +3,11 @@ from sys import stdout
 # invoke parent (TAMV) _logger
 _logger = logging.getLogger('TAMV.SettingsDialog')
 
-from cv2 import cvtColor, COLOR_BGR2RGB
 from PyQt5.QtWidgets import * #QDialog, QWidget, QVBoxLayout, QTabWidgetQ, QPushButton, QComboBox, QSlider, QLabel
 from PyQt5.QtCore import *
-import traceback, copy
+import json
+import os
+import threading
 
 # Configuration settings dialog box
 class SettingsDialog(QDialog):
@@ -22,6 +23,7 @@ class SettingsDialog(QDialog):
     settingsStatusbarSignal = pyqtSignal(object)
     settingsUpdateSignal = pyqtSignal(object)
     settingsNewPrinter = pyqtSignal(object)
+    settingsCamerasProbedSignal = pyqtSignal(object)
 
     def __init__(self, *args, **kwargs):
         # send calling to log
@@ -39,7 +41,9 @@ class SettingsDialog(QDialog):
         except KeyError:
             self.__geometry = None
         try:
-            self.__settings = copy.deepcopy(kwargs['settings'])
+            # settings are JSON-safe, so a C-accelerated json round-trip
+            # snapshots them much faster than copy.deepcopy
+            self.__settings = json.loads(json.dumps(kwargs['settings']))
             self.__originalSettingsObject = kwargs['settings']
         except KeyError:
             self.__settings = None
@@ -61,6 +65,15 @@ class SettingsDialog(QDialog):
         # Restore geometry if available
         if(self.__geometry is not None):
             self.restoreGeometry(self.__geometry)
+        # coalesce slider moves into one image-properties message every 30ms,
+        # so a drag doesn't issue a blocking camera control write per tick
+        self.__pendingImageProperties = {}
+        self.__imagePropertiesTimer = QTimer(self)
+        self.__imagePropertiesTimer.setSingleShot(True)
+        self.__imagePropertiesTimer.setInterval(30)
+        self.__imagePropertiesTimer.timeout.connect(self.applyImageProperties)
+        # queued hand-off from the camera probe worker thread to the GUI thread
+        self.settingsCamerasProbedSignal.connect(self.addDiscoveredCameras)
         # Set layout details
         self.layout = QVBoxLayout()
         self.layout.setSpacing(3)
@@ -138,29 +151,17 @@ class SettingsDialog(QDialog):
         except Exception:
             errorMsg = 'Error fetching camera parameters.'
             self.settingsStatusbarSignal.emit(errorMsg)
-            _logger.error('Error fetching camera parameters.\n' + traceback.format_exc())
+            _logger.error('Error fetching camera parameters.', exc_info=True)
         ############# CAMERA TAB: ITEMS
         # Camera Combobox
         self.camera_combo = QComboBox()
-        for camera in self.__settings['camera']:
-            if(camera['default'] == 1):
-                camera_description = '* ' + str(camera['video_src']) + ': ' + str(camera['display_width']) + 'x' + str(camera['display_height']) 
-            else:
-                camera_description = str(camera['video_src']) + ': ' + str(camera['display_width']) + 'x' + str(camera['display_height']) 
-            self.camera_combo.addItem(camera_description)
+        # populate in one model insert instead of one per row
+        self.camera_combo.addItems([self.describeCamera(camera) for camera in self.__settings['camera']])
         #HBHBHBHB: TODO need to pass actual video source string object from parameter helper function!!!
         #self.camera_combo.currentIndexChanged.connect(self.parent().video_thread.changeVideoSrc)
         
-        #HBHBHBHB TODO: write code to fetch cameras
-        # # Get cameras button
-        # self.camera_button = QPushButton('Get cameras')
-        # self.camera_button.clicked.connect(self.getCameras)
-        # if self.parent().video_thread.alignment:
-        #     self.camera_button.setDisabled(True)
-        # else: self.camera_button.setDisabled(False)
-        #self.getCameras()
-        # cmbox.addWidget(self.camera_button)
-        #HBHBHBHB TODO: write code to fetch cameras
+        # append any capture devices discovered on this machine
+        self.getCameras()
         
         # Brightness slider
         self.brightness_slider = QSlider(Qt.Horizontal)
@@ -267,12 +268,10 @@ class SettingsDialog(QDialog):
             self.defaultIndex = 0
             for i, device in enumerate(self.__settings['printer']):
                 if(device['default'] == 1):
-                    printer_description = '(default) ' + device['nickname']
                     self.default_printer = device
                     self.defaultIndex = i
-                else:
-                    printer_description = device['nickname']
-                self.printer_combo.addItem(printer_description)
+            # populate in one model insert instead of one per row
+            self.printer_combo.addItems([('(default) ' if device['default'] == 1 else '') + device['nickname'] for device in self.__settings['printer']])
             # set default printer as the selected index
             self.printer_combo.setCurrentIndex(self.defaultIndex)
             if(self.default_printer is None):
@@ -284,14 +283,14 @@ class SettingsDialog(QDialog):
             toplayout.addWidget(self.printer_combo)
             # Add button
             self.add_printer_button = QPushButton('+')
-            self.add_printer_button.setStyleSheet('background-color: green')
+            self.add_printer_button.setObjectName('active')
             self.add_printer_button.clicked.connect(self.addProfile)
             self.add_printer_button.setToolTip('Add a new profile..')
             self.add_printer_button.setFixedWidth(30)
             toplayout.addWidget(self.add_printer_button)
             # Delete button
             self.delete_printer_button = QPushButton('X')
-            self.delete_printer_button.setStyleSheet('background-color: red')
+            self.delete_printer_button.setObjectName('terminate')
             self.delete_printer_button.clicked.connect(self.deleteProfile)
             self.delete_printer_button.setToolTip('Delete current profile..')
             self.delete_printer_button.setFixedWidth(30)
@@ -345,8 +344,7 @@ class SettingsDialog(QDialog):
         self.controllerName.setToolTip('Machine firmware family/category')
         self.controllerName.setMinimumWidth(180)
         # get controller index from master list
-        for item in self.__firmwareList:
-            self.controllerName.addItem(item)
+        self.controllerName.addItems(self.__firmwareList)
         if(self.__newPrinter is False):
             # get controller index from master list
             listIndex = -1
@@ -433,18 +431,26 @@ class SettingsDialog(QDialog):
     
     def checkDefaults(self):
         _logger.debug('*** calling SettingsDialog.checkDefaults')
-        if(self.printerDefault.isChecked()):
-            index = self.printer_combo.currentIndex()
-            for i,machine in enumerate(self.__settings['printer']):
-                machine['default'] = 0
-                self.printer_combo.setItemText(i, self.__settings['printer'][i]['nickname'])
-            self.__settings['printer'][index]['default']=1
-            self.printer_combo.setItemText(index,'(default) ' + self.__settings['printer'][index]['nickname'])
-        else:
-            # User de-selected default machine
-            index = self.printer_combo.currentIndex()
-            if(index > -1):
-                self.printer_combo.setItemText(self.printer_combo.currentIndex(),self.__settings['printer'][self.printer_combo.currentIndex()]['nickname'])
+        index = self.printer_combo.currentIndex()
+        # coalesce repaints and suppress intermediate signals while retitling rows
+        self.printer_combo.setUpdatesEnabled(False)
+        blocker = QSignalBlocker(self.printer_combo)
+        try:
+            if(self.printerDefault.isChecked()):
+                # only the row losing the default flag needs retitling
+                for i,machine in enumerate(self.__settings['printer']):
+                    if(machine['default'] == 1 and i != index):
+                        self.printer_combo.setItemText(i, machine['nickname'])
+                    machine['default'] = 0
+                self.__settings['printer'][index]['default']=1
+                self.printer_combo.setItemText(index,'(default) ' + self.__settings['printer'][index]['nickname'])
+            else:
+                # User de-selected default machine
+                if(index > -1):
+                    self.printer_combo.setItemText(index,self.__settings['printer'][index]['nickname'])
+        finally:
+            del blocker
+            self.printer_combo.setUpdatesEnabled(True)
         _logger.debug('*** exiting SettingsDialog.checkDefaults')
     
     def addProfile(self):
@@ -476,8 +482,8 @@ class SettingsDialog(QDialog):
         self.printerNickname.setDisabled(False)
         self.controllerName.setDisabled(False)
         self.printerRotated.setDisabled(False)
+        # the #terminate stylesheet rule restores the red background on enable
         self.delete_printer_button.setDisabled(False)
-        self.delete_printer_button.setStyleSheet('background-color: red')
         # update combobox
         self.printer_combo.addItem('New printer..')
         self.printer_combo.setCurrentIndex(len(self.__settings['printer'])-1)
@@ -521,27 +527,29 @@ class SettingsDialog(QDialog):
             self.printerRotated.setDisabled(True)
             self.printer_combo.addItem('+++ Add a new profile --->')
             self.printer_combo.setCurrentIndex(0)
+            # the #terminate:disabled stylesheet rule greys the button out
             self.delete_printer_button.setDisabled(True)
-            self.delete_printer_button.setStyleSheet('background-color: none')
         _logger.debug('*** exiting SettingsDialog.deleteProfile')
     
     def refreshPrinters(self, index):
         _logger.debug('*** calling SettingsDialog.refreshPrinters')
         if(index >= 0):
-            if(len(self.__settings['printer'][index]['address']) > 0):
-                self.printerAddress.setText(self.__settings['printer'][index]['address'])
+            # resolve the selected profile once instead of per field
+            printer = self.__settings['printer'][index]
+            if(len(printer['address']) > 0):
+                self.printerAddress.setText(printer['address'])
             else:
                 self.printerAddress.clear()
-            if(len(self.__settings['printer'][index]['password']) > 0):
-                self.printerPassword.setText(self.__settings['printer'][index]['password'])
+            if(len(printer['password']) > 0):
+                self.printerPassword.setText(printer['password'])
             else:
                 self.printerPassword.clear()
-            if(len(self.__settings['printer'][index]['name']) > 0):
-                self.printerName.setText(self.__settings['printer'][index]['name'])
+            if(len(printer['name']) > 0):
+                self.printerName.setText(printer['name'])
             else:
                 self.printerName.clear()
-            if(len(self.__settings['printer'][index]['nickname']) > 0):
-                self.printerNickname.setText(self.__settings['printer'][index]['nickname'])
+            if(len(printer['nickname']) > 0):
+                self.printerNickname.setText(printer['nickname'])
             else:
                 self.printerNickname.clear()
             # get controller index from master list
@@ -554,15 +562,15 @@ class SettingsDialog(QDialog):
                 self.controllerName.setCurrentIndex(listIndex)
             else:
                 _logger.error('Controller name not found for combobox.')
-            if(len(self.__settings['printer'][index]['version']) > 0):
-                self.versionName.setText(self.__settings['printer'][index]['version'])
+            if(len(printer['version']) > 0):
+                self.versionName.setText(printer['version'])
             else:
                 self.versionName.clear()
-            if(self.__settings['printer'][index]['default'] == 1):
+            if(printer['default'] == 1):
                 self.printerDefault.setChecked(True)
             else:
                 self.printerDefault.setChecked(False)
-            if(self.__settings['printer'][index]['rotated'] == 1):
+            if(printer['rotated'] == 1):
                 self.printerRotated.setChecked(True)
             else:
                 self.printerRotated.setChecked(False)
@@ -572,20 +580,22 @@ class SettingsDialog(QDialog):
         _logger.debug('*** calling SettingsDialog.updateAttributes')
         index = self.printer_combo.currentIndex()
         if(index > -1):
-            self.__settings['printer'][index]['address'] = self.printerAddress.text()
-            self.__settings['printer'][index]['password'] = self.printerPassword.text()
-            self.__settings['printer'][index]['name'] = self.printerName.text()
-            self.__settings['printer'][index]['nickname'] = self.printerNickname.text()
-            self.__settings['printer'][index]['controller'] = self.controllerName.itemText(self.controllerName.currentIndex())
-            self.__settings['printer'][index]['version'] = self.versionName.text()
-            if(self.printerDefault.isChecked()):
-                self.__settings['printer'][index]['default'] = 1
-            else:
-                self.__settings['printer'][index]['default'] = 0
-            if(self.printerRotated.isChecked()):
-                self.__settings['printer'][index]['rotated'] = 1
-            else:
-                self.__settings['printer'][index]['rotated'] = 0
+            printer = self.__settings['printer'][index]
+            updatedValues = {
+                'address': self.printerAddress.text(),
+                'password': self.printerPassword.text(),
+                'name': self.printerName.text(),
+                'nickname': self.printerNickname.text(),
+                'controller': self.controllerName.itemText(self.controllerName.currentIndex()),
+                'version': self.versionName.text(),
+                'default': 1 if self.printerDefault.isChecked() else 0,
+                'rotated': 1 if self.printerRotated.isChecked() else 0
+            }
+            # write back only the fields that actually changed, so an
+            # editingFinished on an untouched field is a no-op
+            for (attribute, value) in updatedValues.items():
+                if(printer[attribute] != value):
+                    printer[attribute] = value
         _logger.debug('*** exiting SettingsDialog.updateAttributes')
     
     def resetCameraToDefaults(self):
@@ -594,95 +604,128 @@ class SettingsDialog(QDialog):
         
         _logger.debug('*** exiting SettingsDialog.resetCameraToDefaults')
     
+    def queueImageProperty(self, propertyName, parameter):
+        # remember only the newest value per property and (re)arm the timer
+        self.__pendingImageProperties[propertyName] = parameter
+        self.__imagePropertiesTimer.start()
+
+    def applyImageProperties(self):
+        if(len(self.__pendingImageProperties) > 0):
+            message = self.__pendingImageProperties
+            self.__pendingImageProperties = {}
+            self.settingsSetImagePropertiesSignal.emit(message)
+
     def changeBrightness(self):
         _logger.debug('*** calling SettingsDialog.changeBrightness')
         parameter = int(self.brightness_slider.value())
-        message = {'brightness': parameter}
-        self.settingsSetImagePropertiesSignal.emit(message)
+        self.queueImageProperty('brightness', parameter)
         self.brightness_label.setText(str(parameter))
         _logger.debug('*** exiting SettingsDialog.changeBrightness')
-    
+
     def changeContrast(self):
         _logger.debug('*** calling SettingsDialog.changeContrast')
         parameter = int(self.contrast_slider.value())
-        message = {'contrast': parameter}
-        self.settingsSetImagePropertiesSignal.emit(message)
+        self.queueImageProperty('contrast', parameter)
         self.contrast_label.setText(str(parameter))
         _logger.debug('*** exiting SettingsDialog.changeContrast')
-    
+
     def changeSaturation(self):
         _logger.debug('*** calling SettingsDialog.changeSaturation')
         parameter = int(self.saturation_slider.value())
-        message = {'saturation': parameter}
-        self.settingsSetImagePropertiesSignal.emit(message)
+        self.queueImageProperty('saturation', parameter)
         self.saturation_label.setText(str(parameter))
         _logger.debug('*** exiting SettingsDialog.changeSaturation')
-    
+
     def changeHue(self):
         _logger.debug('*** calling SettingsDialog.changeHue')
         parameter = int(self.hue_slider.value())
-        message = {'hue': parameter}
-        self.settingsSetImagePropertiesSignal.emit(message)
+        self.queueImageProperty('hue', parameter)
         self.hue_label.setText(str(parameter))
         _logger.debug('*** exiting SettingsDialog.changeHue')
 
+    def describeCamera(self, camera):
+        # single formatting pass for combobox rows, default camera gets a star
+        return(f"{'* ' if camera['default'] == 1 else ''}{camera['video_src']}: {camera['display_width']}x{camera['display_height']}")
+
     def getCameras(self):
         _logger.debug('*** calling SettingsDialog.getCameras')
         #HBHBHBHB: TODO handle multiple camera profiles
-        # # checks the first 6 indexes.
-        # i = 6
-        # index = 0
-        # self.camera_combo.clear()
-        # _cameras = []
-        # #HBHBHBHB DEBUG camera description
-        # original_camera_description = '* ' + str(camera['video_src'])
-        # _cameras.append(original_camera_description)
-        # tempCap = cv2.VideoCapture()
-        # tempCap.setExceptionMode(True)
-        # while i > 0:
-        #     if index != self.parent()._videoSrc:
-        #         try:
-        #             tempCap.open(index)
-        #             if tempCap.read()[0]:
-        #                 api = tempCap.getBackendName()
-        #                 camera_description = str(index) + ': ' \
-        #                     + str(int(tempCap.get(cv2.CAP_PROP_FRAME_WIDTH))) \
-        #                     + 'x' + str(int(tempCap.get(cv2.CAP_PROP_FRAME_HEIGHT))) + ' @ ' \
-        #                     + str(int(tempCap.get(cv2.CAP_PROP_FPS))) + 'fps'
-        #                 _cameras.append(camera_description)
-        #             tempCap.release()
-        #         except:
-        #             index += 1
-        #             i -= 1
-        #             continue
-        #     index += 1
-        #     i -= 1
-        # #cameras = [line for line in allOutputs if float(line['propmode']) > -1 ]
-        # _cameras.sort()
-        # for camera in _cameras:
-        #     self.camera_combo.addItem(camera)
-        # self.camera_combo.setCurrentText(original_camera_description)
+        # enumerate capture devices from the kernel metadata in /sys/class/video4linux
+        # instead of opening each index with cv2.VideoCapture, which blocks for
+        # seconds per probe while the GUI freezes
+        cameras = []
+        v4lPath = '/sys/class/video4linux'
+        try:
+            for entry in sorted(os.listdir(v4lPath)):
+                try:
+                    videoSrc = int(entry.replace('video',''))
+                except ValueError:
+                    continue
+                try:
+                    with open(os.path.join(v4lPath, entry, 'index')) as indexFile:
+                        # only index 0 nodes expose a capture stream, the others are metadata nodes
+                        if(int(indexFile.read().strip()) != 0):
+                            continue
+                except OSError: pass
+                try:
+                    with open(os.path.join(v4lPath, entry, 'name')) as nameFile:
+                        deviceName = nameFile.read().strip()
+                except OSError:
+                    deviceName = entry
+                cameras.append((videoSrc, deviceName))
+        except OSError:
+            # non-Linux platform or sysfs unavailable: fall back to a bounded probe.
+            # Opening devices blocks for seconds, so run it on a worker thread and
+            # deliver the results back to the GUI thread via a queued signal.
+            _logger.debug('getCameras: no video4linux sysfs tree available, probing indices')
+            probeThread = threading.Thread(target=self.probeCameras)
+            probeThread.daemon = True
+            probeThread.start()
+            _logger.debug('*** exiting SettingsDialog.getCameras')
+            return
+        self.addDiscoveredCameras(cameras)
         _logger.debug('*** exiting SettingsDialog.getCameras')
+
+    def probeCameras(self):
+        # worker-thread probe that stops after two consecutive missing indices,
+        # since capture indices are allocated contiguously
+        import cv2
+        cameras = []
+        consecutiveFailures = 0
+        for index in range(6):
+            probeCap = cv2.VideoCapture(index)
+            if(probeCap.read()[0]):
+                consecutiveFailures = 0
+                cameras.append((index, probeCap.getBackendName()))
+            else:
+                consecutiveFailures += 1
+            probeCap.release()
+            if(consecutiveFailures >= 2):
+                break
+        self.settingsCamerasProbedSignal.emit(cameras)
+
+    @pyqtSlot(object)
+    def addDiscoveredCameras(self, cameras):
+        # configured sources already carry their resolution in the combobox,
+        # so only append discovered devices that aren't configured yet
+        knownSources = [camera['video_src'] for camera in self.__settings['camera']]
+        for (videoSrc, deviceName) in cameras:
+            if(videoSrc not in knownSources):
+                self.camera_combo.addItem(f'{videoSrc}: {deviceName}')
     
     def updatePrinterObjects(self):
         _logger.debug('*** calling SettingsDialog.updatePrinterObjects')
-        defaultSet = False
-        multipleDefaults = False
-        defaultMessage = "More than one connection is set as the default option.\n\nPlease review the connections for:\n\n"
         # Do some data cleaning
         for machine in self.__settings['printer']:
             # Check if user forgot a nickname, default to printer address
             if(machine['nickname'] is None or machine['nickname'] == ""):
                 machine['nickname'] = machine['address']
-            # Do some checking to catch multiple default printers set at the same time
-            if(machine['default'] == 1):
-                defaultMessage += "  - " + machine['nickname'] + "\n"
-                if(defaultSet):
-                    multipleDefaults = True
-                else:
-                    defaultSet = True
+        # Do some checking to catch multiple default printers set at the same time
+        defaultNicknames = [machine['nickname'] for machine in self.__settings['printer'] if machine['default'] == 1]
         # More than one profile is set as the default. Alert user, don't save, and return to the settings screen
-        if(multipleDefaults):
+        if(len(defaultNicknames) > 1):
+            defaultMessage = "More than one connection is set as the default option.\n\nPlease review the connections for:\n\n"
+            defaultMessage += "".join(["  - " + nickname + "\n" for nickname in defaultNicknames])
             msgBox = QMessageBox()
             msgBox.setIcon(QMessageBox.Warning)
             msgBox.setText(defaultMessage)
@@ -691,7 +734,7 @@ class SettingsDialog(QDialog):
             msgBox.exec()
             return
         # No default printed was defined, so set first item to default
-        if(defaultSet is False and len(self.__settings['printer']) > 0):
+        if(len(defaultNicknames) == 0 and len(self.__settings['printer']) > 0):
             self.__settings['printer'][0]['default'] = 1
         elif(len(self.__settings['printer']) == 0):
             # All profiles have been cleared. Add a dummy template